@@ -10,6 +10,9 @@ from pathlib import Path
 from shared.constants import EXCLUDED_DIRS, TF_FILE_PATTERN, TF_LOCKFILE_NAME
 from shared.schemas import TerraformDetection
 
+# Frozen once at import so the directory filter is a constant-time probe
+_EXCLUDED = frozenset(EXCLUDED_DIRS)
+
 
 def scan_for_terraform(root_path: str | Path = ".") -> TerraformDetection:
     """Scan a directory tree for Terraform files.
@@ -21,31 +24,47 @@ def scan_for_terraform(root_path: str | Path = ".") -> TerraformDetection:
         TerraformDetection with scan results
     """
     root = Path(root_path).resolve()
-    tf_files: list[Path] = []
+    tf_files: list[str] = []
     tf_dirs: set[str] = set()
     lockfile_found = False
 
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Filter out excluded directories (modifies dirnames in-place)
-        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith(".")]
-
-        current_dir = Path(dirpath)
-        rel_dir = current_dir.relative_to(root)
-
-        for filename in filenames:
-            # Check for .tf files
-            if filename.endswith(".tf"):
-                tf_files.append(current_dir / filename)
-                # Store relative path of directory, or "." for root
-                dir_str = str(rel_dir) if str(rel_dir) != "." else "."
-                tf_dirs.add(dir_str)
-
-            # Check for lockfile
-            if filename == TF_LOCKFILE_NAME:
-                lockfile_found = True
-
-    # Convert tf_files to relative paths for output
-    tf_file_paths = [str(f.relative_to(root)) for f in sorted(tf_files)]
+    # Iterative walk over (absolute, relative) directory pairs. os.scandir hands
+    # back cached names and entry types, so no per-entry stat or Path math is needed.
+    stack: list[tuple[str, str]] = [(str(root), ".")]
+
+    # Bind hot lookups to locals once, outside the per-entry loop
+    push = stack.append
+    add_file = tf_files.append
+    excluded = _EXCLUDED
+    lockfile_name = TF_LOCKFILE_NAME
+
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        # Relative prefix for children of this directory ("" at the root)
+        prefix = "" if rel_dir == "." else rel_dir + os.sep
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    name = entry.name
+
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip excluded and hidden directories before descending
+                        if name[:1] == "." or name in excluded:
+                            continue
+                        push((entry.path, prefix + name))
+                        continue
+
+                    # Check for .tf files
+                    if name.endswith(".tf"):
+                        add_file(prefix + name)
+                        # Store relative path of directory, or "." for root
+                        tf_dirs.add(rel_dir)
+                    # Check for lockfile
+                    elif name == lockfile_name:
+                        lockfile_found = True
+        except OSError:
+            # Unreadable directory - skip it, as os.walk would
+            continue
 
     return TerraformDetection(
         detected=len(tf_files) > 0,
@@ -78,9 +97,8 @@ def get_tf_root_paths(detection: TerraformDetection) -> list[str]:
 
 if __name__ == "__main__":
     # Quick test
-    import json
     import sys
 
     path = sys.argv[1] if len(sys.argv) > 1 else "."
     result = scan_for_terraform(path)
-    print(json.dumps(result.model_dump(), indent=2))
+    print(result.model_dump_json(indent=2))
@@ -3,9 +3,14 @@
 Runs terraform init and validate to perform machine-based evaluation.
 """
 
+import asyncio
+import json
+import os
+import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -27,19 +32,43 @@ class TerraformEvalResult:
 def get_terraform_version() -> str | None:
     """Get the installed Terraform version.
 
+    The result is memoized per binary (path + mtime), so repeated calls within
+    a run do not spawn ``terraform version`` again.
+
     Returns:
         Version string (e.g., "1.6.0") or None if Terraform not found
     """
+    terraform_path = shutil.which("terraform")
+    if terraform_path is None:
+        return None
+
+    try:
+        mtime_ns = os.stat(terraform_path).st_mtime_ns
+    except OSError:
+        return None
+
+    return _query_terraform_version(terraform_path, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _query_terraform_version(terraform_path: str, mtime_ns: int) -> str | None:
+    """Query a Terraform binary for its version.
+
+    Args:
+        terraform_path: Absolute path to the terraform executable
+        mtime_ns: Modification time of the executable (cache key only)
+
+    Returns:
+        Version string or None if it could not be determined
+    """
     try:
         result = subprocess.run(
-            ["terraform", "version", "-json"],
+            [terraform_path, "version", "-json"],
             capture_output=True,
             text=True,
             timeout=30,
         )
         if result.returncode == 0:
-            import json
-
             version_info = json.loads(result.stdout)
             return version_info.get("terraform_version")
     except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
@@ -48,7 +77,7 @@ def get_terraform_version() -> str | None:
     # Fallback to non-JSON version output
     try:
         result = subprocess.run(
-            ["terraform", "version"],
+            [terraform_path, "version"],
             capture_output=True,
             text=True,
             timeout=30,
@@ -64,7 +93,47 @@ def get_terraform_version() -> str | None:
     return None
 
 
-def run_terraform_init(working_dir: str | Path) -> tuple[bool, str, str]:
+async def _run_terraform_command(
+    args: list[str],
+    working_dir: str | Path,
+    timeout: float,
+) -> tuple[int, str, str]:
+    """Run a terraform subcommand without blocking the event loop.
+
+    Args:
+        args: Arguments passed to the terraform executable
+        working_dir: Directory to run the command in
+        timeout: Seconds to wait before killing the process
+
+    Returns:
+        Tuple of (return code, stdout, stderr)
+
+    Raises:
+        TimeoutError: If the command did not finish within ``timeout``
+        FileNotFoundError: If the terraform executable is not installed
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "terraform",
+        *args,
+        cwd=working_dir,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+    return (
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def run_terraform_init(working_dir: str | Path) -> tuple[bool, str, str]:
     """Run terraform init with backend disabled.
 
     Args:
@@ -74,15 +143,13 @@ def run_terraform_init(working_dir: str | Path) -> tuple[bool, str, str]:
         Tuple of (success, stdout, stderr)
     """
     try:
-        result = subprocess.run(
-            ["terraform", "init", "-backend=false", "-no-color"],
-            cwd=working_dir,
-            capture_output=True,
-            text=True,
+        returncode, stdout, stderr = await _run_terraform_command(
+            ["init", "-backend=false", "-no-color"],
+            working_dir,
             timeout=300,  # 5 minutes timeout for init
         )
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
+        return returncode == 0, stdout, stderr
+    except TimeoutError:
         return False, "", "Terraform init timed out after 5 minutes"
     except FileNotFoundError:
         return False, "", "Terraform executable not found"
@@ -90,7 +157,7 @@ def run_terraform_init(working_dir: str | Path) -> tuple[bool, str, str]:
         return False, "", f"Terraform init failed: {str(e)}"
 
 
-def run_terraform_validate(working_dir: str | Path) -> tuple[bool, str, str]:
+async def run_terraform_validate(working_dir: str | Path) -> tuple[bool, str, str]:
     """Run terraform validate.
 
     Args:
@@ -100,15 +167,13 @@ def run_terraform_validate(working_dir: str | Path) -> tuple[bool, str, str]:
         Tuple of (success, stdout, stderr)
     """
     try:
-        result = subprocess.run(
-            ["terraform", "validate", "-no-color"],
-            cwd=working_dir,
-            capture_output=True,
-            text=True,
+        returncode, stdout, stderr = await _run_terraform_command(
+            ["validate", "-no-color"],
+            working_dir,
             timeout=120,  # 2 minutes timeout for validate
         )
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
+        return returncode == 0, stdout, stderr
+    except TimeoutError:
         return False, "", "Terraform validate timed out after 2 minutes"
     except FileNotFoundError:
         return False, "", "Terraform executable not found"
@@ -116,8 +181,10 @@ def run_terraform_validate(working_dir: str | Path) -> tuple[bool, str, str]:
         return False, "", f"Terraform validate failed: {str(e)}"
 
 
-def evaluate_terraform(working_dir: str | Path = ".") -> TerraformEvalResult:
-    """Run full Terraform evaluation (init + validate).
+async def evaluate_terraform_async(working_dir: str | Path = ".") -> TerraformEvalResult:
+    """Run full Terraform evaluation (init + validate) on the event loop.
+
+    Several roots can be evaluated concurrently with ``asyncio.gather``.
 
     Args:
         working_dir: Directory containing Terraform configuration
@@ -143,7 +210,7 @@ def evaluate_terraform(working_dir: str | Path = ".") -> TerraformEvalResult:
         )
 
     # Run terraform init
-    init_success, init_output, init_error = run_terraform_init(working_dir)
+    init_success, init_output, init_error = await run_terraform_init(working_dir)
     if not init_success:
         return TerraformEvalResult(
             success=False,
@@ -158,7 +225,7 @@ def evaluate_terraform(working_dir: str | Path = ".") -> TerraformEvalResult:
         )
 
     # Run terraform validate
-    validate_success, validate_output, validate_error = run_terraform_validate(working_dir)
+    validate_success, validate_output, validate_error = await run_terraform_validate(working_dir)
 
     return TerraformEvalResult(
         success=validate_success,
@@ -173,10 +240,22 @@ def evaluate_terraform(working_dir: str | Path = ".") -> TerraformEvalResult:
     )
 
 
+def evaluate_terraform(working_dir: str | Path = ".") -> TerraformEvalResult:
+    """Run full Terraform evaluation (init + validate).
+
+    Synchronous wrapper around :func:`evaluate_terraform_async`.
+
+    Args:
+        working_dir: Directory containing Terraform configuration
+
+    Returns:
+        TerraformEvalResult with evaluation results
+    """
+    return asyncio.run(evaluate_terraform_async(working_dir))
+
+
 if __name__ == "__main__":
     # Quick test
-    import json
-
     path = sys.argv[1] if len(sys.argv) > 1 else "."
     result = evaluate_terraform(path)
     print(f"Success: {result.success}")
@@ -4,7 +4,6 @@ Generates the complete evidence pack artifact for KSI-MLA-05.
 """
 
 import hashlib
-import json
 import os
 import sys
 import zipfile
@@ -12,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
 from shared.constants import ARTIFACT_PREFIX, CRITERIA_DEFINITIONS, KSI_ID, KSI_REQUIREMENT_TEXT
 from shared.schemas import (
     CollectedAt,
@@ -30,6 +30,21 @@ from shared.schemas import (
 )
 
 from action.src.evaluate import TerraformEvalResult
+from action.src.serialization import dump_json_bytes, zip_compress_type
+
+# Criterion names and reasons, unpacked once from the locked definitions
+_MLA05_A_NAME = CRITERIA_DEFINITIONS["MLA05-A"]["name"]
+_MLA05_A_PASS = CRITERIA_DEFINITIONS["MLA05-A"]["pass_reason"]
+_MLA05_A_FAIL = CRITERIA_DEFINITIONS["MLA05-A"]["fail_reason"]
+_MLA05_B_NAME = CRITERIA_DEFINITIONS["MLA05-B"]["name"]
+_MLA05_B_PASS = CRITERIA_DEFINITIONS["MLA05-B"]["pass_reason"]
+_MLA05_B_ERROR = CRITERIA_DEFINITIONS["MLA05-B"]["error_reason"]
+_MLA05_C_NAME = CRITERIA_DEFINITIONS["MLA05-C"]["name"]
+_MLA05_C_PASS = CRITERIA_DEFINITIONS["MLA05-C"]["pass_reason"]
+_MLA05_C_FAIL = CRITERIA_DEFINITIONS["MLA05-C"]["fail_reason"]
+_MLA05_D_NAME = CRITERIA_DEFINITIONS["MLA05-D"]["name"]
+_MLA05_D_PASS = CRITERIA_DEFINITIONS["MLA05-D"]["pass_reason"]
+_MLA05_D_ERROR = CRITERIA_DEFINITIONS["MLA05-D"]["error_reason"]
 
 
 class EvidencePackBuilder:
@@ -44,8 +59,16 @@ class EvidencePackBuilder:
         self.output_dir = Path(output_dir).resolve()
         self.evidence_dir = self.output_dir / "evidence" / "ksi-mla-05"
         self.declared_dir = self.evidence_dir / "declared"
+        # Plain-string roots for building per-file paths without Path objects
+        self._output_abs = str(self.output_dir)
+        self._evidence_rel = "evidence/ksi-mla-05"
         self.files_written: list[tuple[str, str]] = []  # (relative_path, description)
+        self.file_hashes: dict[str, str] = {}  # relative_path -> SHA-256 hex digest
+        self.payloads: dict[str, bytes] = {}  # relative_path -> bytes written
         self.timestamp = datetime.now(timezone.utc)
+        # Formatted once; every artifact in the pack shares the same timestamp
+        self.timestamp_iso = self.timestamp.isoformat()
+        self.timestamp_zip = self.timestamp.strftime("%Y%m%dT%H%M%SZ")
 
     def setup_directories(self) -> None:
         """Create evidence directory structure."""
@@ -70,50 +93,79 @@ class EvidencePackBuilder:
         Returns:
             Path to written file
         """
+        return self._write_payload(filename, dump_json_bytes(data), description, subdir)
+
+    def write_model_file(
+        self,
+        filename: str,
+        model: BaseModel,
+        description: str,
+        subdir: str | None = None,
+    ) -> Path:
+        """Write a pydantic model to the evidence pack as JSON.
+
+        Serializes directly with ``model_dump_json`` so no intermediate dict
+        is built.
+
+        Args:
+            filename: Name of the file
+            model: Model to write as JSON
+            description: Description for manifest
+            subdir: Optional subdirectory (e.g., "declared")
+
+        Returns:
+            Path to written file
+        """
+        payload = model.model_dump_json(indent=2).encode("utf-8")
+        return self._write_payload(filename, payload, description, subdir)
+
+    def _write_payload(
+        self,
+        filename: str,
+        payload: bytes,
+        description: str,
+        subdir: str | None,
+    ) -> Path:
+        """Write serialized JSON bytes and record them for the manifest.
+
+        Target directories are created up front by setup_directories().
+        """
         if subdir:
-            target_dir = self.evidence_dir / subdir
-            rel_path = f"evidence/ksi-mla-05/{subdir}/{filename}"
+            rel_path = f"{self._evidence_rel}/{subdir}/{filename}"
         else:
-            target_dir = self.evidence_dir
-            rel_path = f"evidence/ksi-mla-05/{filename}"
+            rel_path = f"{self._evidence_rel}/{filename}"
+        file_path = os.path.join(self._output_abs, rel_path)
 
-        target_dir.mkdir(parents=True, exist_ok=True)
-        file_path = target_dir / filename
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # The same bytes are written and hashed
+        with open(file_path, "wb") as f:
+            f.write(payload)
 
         self.files_written.append((rel_path, description))
-        return file_path
+        self.file_hashes[rel_path] = hashlib.sha256(payload).hexdigest()
+        self.payloads[rel_path] = payload
+        return Path(file_path)
 
     def write_collected_at(self) -> None:
         """Write collected_at.json."""
-        data = CollectedAt(
-            timestamp=self.timestamp.isoformat(),
+        data = CollectedAt.model_construct(
+            timestamp=self.timestamp_iso,
             timezone="UTC",
         )
-        self.write_json_file(
+        self.write_model_file(
             "collected_at.json",
-            data.model_dump(),
+            data,
             "Timestamp of evidence collection",
         )
 
-    def write_scope(
-        self,
-        repository: str,
-        commit_sha: str,
-        tf_paths: list[str],
-    ) -> None:
-        """Write scope.json."""
-        data = ScopeInfo(
-            repository=repository,
-            commit_sha=commit_sha,
-            configuration_surfaces=["TERRAFORM"],
-            terraform_paths=tf_paths,
-        )
-        self.write_json_file(
+    def write_scope(self, scope_info: ScopeInfo) -> None:
+        """Write scope.json.
+
+        Args:
+            scope_info: Evaluation scope, reused for the evaluation manifest
+        """
+        self.write_model_file(
             "scope.json",
-            data.model_dump(),
+            scope_info,
             "Scope of the evaluation",
         )
 
@@ -123,31 +175,31 @@ class EvidencePackBuilder:
         action_version: str = "1.0.0",
     ) -> None:
         """Write tools.json."""
-        data = ToolsInfo(
+        data = ToolsInfo.model_construct(
             terraform_version=terraform_version,
             action_version=action_version,
             python_version=f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         )
-        self.write_json_file(
+        self.write_model_file(
             "tools.json",
-            data.model_dump(),
+            data,
             "Tools and versions used for evaluation",
         )
 
     def write_terraform_detection(self, detection: TerraformDetection) -> None:
         """Write terraform_detection.json."""
-        self.write_json_file(
+        self.write_model_file(
             "terraform_detection.json",
-            detection.model_dump(),
+            detection,
             "Terraform detection results",
             subdir="declared",
         )
 
     def write_terraform_inventory(self, inventory: TerraformInventory) -> None:
         """Write terraform_inventory.json."""
-        self.write_json_file(
+        self.write_model_file(
             "terraform_inventory.json",
-            inventory.model_dump(),
+            inventory,
             "Terraform configuration inventory",
             subdir="declared",
         )
@@ -170,116 +222,114 @@ class EvidencePackBuilder:
         Returns:
             List of CriterionResult for each criterion
         """
+        # Results are assembled from locked constants and internal state, so
+        # model_construct is used to skip redundant validation.
         criteria: list[CriterionResult] = []
 
         # MLA05-A: Configuration Surface in Scope
-        mla05_a = CRITERIA_DEFINITIONS["MLA05-A"]
         if detection.detected:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-A",
-                    name=mla05_a["name"],
+                    name=_MLA05_A_NAME,
                     status=CriterionStatus.PASS,
-                    reason=mla05_a["pass_reason"],
+                    reason=_MLA05_A_PASS,
                     details={"tf_file_count": detection.tf_file_count},
                 )
             )
         else:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-A",
-                    name=mla05_a["name"],
+                    name=_MLA05_A_NAME,
                     status=CriterionStatus.FAIL,
-                    reason=mla05_a["fail_reason"],
+                    reason=_MLA05_A_FAIL,
                 )
             )
 
         # MLA05-B: Machine-Based Evaluation Performed
-        mla05_b = CRITERIA_DEFINITIONS["MLA05-B"]
         if eval_result is None:
             # Evaluation was skipped (no Terraform)
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-B",
-                    name=mla05_b["name"],
+                    name=_MLA05_B_NAME,
                     status=CriterionStatus.SKIP,
                     reason="Evaluation skipped - no Terraform configuration detected.",
                 )
             )
         elif eval_result.success:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-B",
-                    name=mla05_b["name"],
+                    name=_MLA05_B_NAME,
                     status=CriterionStatus.PASS,
-                    reason=mla05_b["pass_reason"],
+                    reason=_MLA05_B_PASS,
                     details={"terraform_version": eval_result.terraform_version},
                 )
             )
         elif eval_result.error_message and "not found" in eval_result.error_message.lower():
             # Tooling error - Terraform not installed
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-B",
-                    name=mla05_b["name"],
+                    name=_MLA05_B_NAME,
                     status=CriterionStatus.ERROR,
-                    reason=mla05_b["error_reason"],
+                    reason=_MLA05_B_ERROR,
                     details={"error": eval_result.error_message},
                 )
             )
         else:
             # Validation failed
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-B",
-                    name=mla05_b["name"],
+                    name=_MLA05_B_NAME,
                     status=CriterionStatus.ERROR,
-                    reason=mla05_b["error_reason"],
+                    reason=_MLA05_B_ERROR,
                     details={"error": eval_result.error_message},
                 )
             )
 
         # MLA05-C: Persistent Cycle Configured
-        mla05_c = CRITERIA_DEFINITIONS["MLA05-C"]
         if trigger_event == "schedule":
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-C",
-                    name=mla05_c["name"],
+                    name=_MLA05_C_NAME,
                     status=CriterionStatus.PASS,
-                    reason=mla05_c["pass_reason"],
+                    reason=_MLA05_C_PASS,
                     details={"trigger_event": trigger_event},
                 )
             )
         else:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-C",
-                    name=mla05_c["name"],
+                    name=_MLA05_C_NAME,
                     status=CriterionStatus.FAIL,
-                    reason=mla05_c["fail_reason"],
+                    reason=_MLA05_C_FAIL,
                     details={"trigger_event": trigger_event},
                 )
             )
 
         # MLA05-D: Evidence Artifacts Generated
-        mla05_d = CRITERIA_DEFINITIONS["MLA05-D"]
         if evidence_generated:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-D",
-                    name=mla05_d["name"],
+                    name=_MLA05_D_NAME,
                     status=CriterionStatus.PASS,
-                    reason=mla05_d["pass_reason"],
+                    reason=_MLA05_D_PASS,
                 )
             )
         else:
             criteria.append(
-                CriterionResult(
+                CriterionResult.model_construct(
                     id="MLA05-D",
-                    name=mla05_d["name"],
+                    name=_MLA05_D_NAME,
                     status=CriterionStatus.ERROR,
-                    reason=mla05_d["error_reason"],
+                    reason=_MLA05_D_ERROR,
                 )
             )
 
@@ -299,13 +349,20 @@ class EvidencePackBuilder:
         Returns:
             Tuple of (overall status, list of reasons)
         """
-        has_error = any(c.status == CriterionStatus.ERROR for c in criteria)
-        has_fail = any(c.status == CriterionStatus.FAIL for c in criteria)
-
+        has_error = False
+        has_fail = False
         reasons: list[str] = []
+
+        # Single pass; enum members are singletons, so identity checks suffice
         for c in criteria:
-            if c.status in (CriterionStatus.ERROR, CriterionStatus.FAIL):
-                reasons.append(f"{c.id}: {c.reason}")
+            status = c.status
+            if status is CriterionStatus.ERROR:
+                has_error = True
+            elif status is CriterionStatus.FAIL:
+                has_fail = True
+            else:
+                continue
+            reasons.append(f"{c.id}: {c.reason}")
 
         if has_error:
             return KSIStatus.ERROR, reasons
@@ -343,20 +400,20 @@ class EvidencePackBuilder:
         # Compute overall status
         status, reasons = self.compute_overall_status(criteria)
 
-        manifest = EvaluationManifest(
+        manifest = EvaluationManifest.model_construct(
             ksi_id=KSI_ID,
             requirement_text=KSI_REQUIREMENT_TEXT,
             status=status,
             reasons=reasons,
-            evaluated_at=self.timestamp.isoformat(),
+            evaluated_at=self.timestamp_iso,
             scope=scope_info,
             process=process_info,
             criteria=criteria,
         )
 
-        self.write_json_file(
+        self.write_model_file(
             "evaluation_manifest.json",
-            manifest.model_dump(),
+            manifest,
             "Primary evaluation manifest with PASS/FAIL/ERROR status",
         )
 
@@ -365,45 +422,36 @@ class EvidencePackBuilder:
     def write_manifest(self, repository: str, commit_sha: str) -> None:
         """Write manifest.json - index of all files."""
         files = [
-            FileEntry(path=path, description=desc, schema_version="1.0")
+            FileEntry.model_construct(path=path, description=desc, schema_version="1.0")
             for path, desc in self.files_written
         ]
 
-        manifest = EvidenceManifest(
+        manifest = EvidenceManifest.model_construct(
             ksi_id=KSI_ID,
-            generated_at=self.timestamp.isoformat(),
+            generated_at=self.timestamp_iso,
             commit_sha=commit_sha,
             repository=repository,
             files=files,
         )
 
-        self.write_json_file(
+        self.write_model_file(
             "manifest.json",
-            manifest.model_dump(),
+            manifest,
             "Index of all evidence files",
         )
 
     def write_hashes(self) -> None:
         """Write hashes.sha256 - SHA-256 hashes of all files."""
-        hashes: list[str] = []
-
-        for rel_path, _ in self.files_written:
-            # Convert relative path to absolute
-            abs_path = self.output_dir / rel_path
-            if abs_path.exists():
-                sha256 = hashlib.sha256()
-                with open(abs_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        sha256.update(chunk)
-                hashes.append(f"{sha256.hexdigest()}  {rel_path}")
-
-        # Write hashes file
-        hashes_path = self.evidence_dir / "hashes.sha256"
-        with open(hashes_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(hashes) + "\n")
-
-        self.files_written.append(
-            ("evidence/ksi-mla-05/hashes.sha256", "SHA-256 hashes of all evidence files")
+        # Digests were computed from the in-memory payloads in _write_payload
+        payload = "".join(
+            f"{self.file_hashes[rel_path]}  {rel_path}\n" for rel_path, _ in self.files_written
+        ).encode("utf-8")
+
+        self._write_payload(
+            "hashes.sha256",
+            payload,
+            "SHA-256 hashes of all evidence files",
+            None,
         )
 
     def create_zip(self, commit_sha: str) -> tuple[Path, str]:
@@ -416,15 +464,17 @@ class EvidencePackBuilder:
             Tuple of (zip_path, artifact_name)
         """
         short_sha = commit_sha[:7]
-        timestamp_str = self.timestamp.strftime("%Y%m%dT%H%M%SZ")
-        artifact_name = f"{ARTIFACT_PREFIX}_{short_sha}_{timestamp_str}.zip"
+        artifact_name = f"{ARTIFACT_PREFIX}_{short_sha}_{self.timestamp_zip}.zip"
         zip_path = self.output_dir / artifact_name
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Evidence files are small JSON documents; the fastest deflate level keeps
+        # nearly all of the size win at a fraction of the CPU cost, and the
+        # smallest files are stored as-is.
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            # Archive the payloads kept in memory rather than reading files back
             for rel_path, _ in self.files_written:
-                abs_path = self.output_dir / rel_path
-                if abs_path.exists():
-                    zf.write(abs_path, rel_path)
+                payload = self.payloads[rel_path]
+                zf.writestr(rel_path, payload, compress_type=zip_compress_type(payload))
 
         return zip_path, artifact_name
 
@@ -445,7 +495,7 @@ class EvidencePackBuilder:
             KSIStatus.ERROR: "KSI-MLA-05 evaluation encountered errors. Unable to determine compliance status.",
         }
 
-        summary = ResultsSummary(
+        summary = ResultsSummary.model_construct(
             ksi_id=KSI_ID,
             status=status,
             artifact_name=artifact_name,
@@ -454,8 +504,7 @@ class EvidencePackBuilder:
 
         # Write to output dir root (not in evidence subdir)
         results_path = self.output_dir / "results.json"
-        with open(results_path, "w", encoding="utf-8") as f:
-            json.dump(summary.model_dump(), f, indent=2)
+        results_path.write_bytes(summary.model_dump_json(indent=2).encode("utf-8"))
 
 
 def build_evidence_pack(
@@ -491,12 +540,70 @@ def build_evidence_pack(
     Returns:
         Tuple of (zip_path, artifact_name, overall_status)
     """
+    zip_path, artifact_name, status, _ = build_evidence_pack_with_manifest(
+        output_dir=output_dir,
+        detection=detection,
+        inventory=inventory,
+        eval_result=eval_result,
+        repository=repository,
+        commit_sha=commit_sha,
+        workflow_name=workflow_name,
+        workflow_run_id=workflow_run_id,
+        workflow_run_url=workflow_run_url,
+        trigger_event=trigger_event,
+        actor=actor,
+        terraform_version=terraform_version,
+    )
+    return zip_path, artifact_name, status
+
+
+def build_evidence_pack_with_manifest(
+    output_dir: str | Path,
+    detection: TerraformDetection,
+    inventory: TerraformInventory | None,
+    eval_result: TerraformEvalResult | None,
+    repository: str,
+    commit_sha: str,
+    workflow_name: str,
+    workflow_run_id: str,
+    workflow_run_url: str,
+    trigger_event: str,
+    actor: str,
+    terraform_version: str | None = None,
+) -> tuple[Path, str, KSIStatus, EvaluationManifest]:
+    """Build complete evidence pack, also returning the evaluation manifest.
+
+    Args:
+        output_dir: Directory to write evidence
+        detection: Terraform detection results
+        inventory: Terraform inventory (None if no TF detected)
+        eval_result: Terraform evaluation results (None if not run)
+        repository: Repository name (owner/repo)
+        commit_sha: Full commit SHA
+        workflow_name: Name of the workflow
+        workflow_run_id: Workflow run ID
+        workflow_run_url: URL to workflow run
+        trigger_event: Event that triggered workflow
+        actor: User/bot that triggered workflow
+        terraform_version: Terraform version if available
+
+    Returns:
+        Tuple of (zip_path, artifact_name, overall_status, evaluation manifest)
+    """
     builder = EvidencePackBuilder(output_dir)
     builder.setup_directories()
 
+    # Build scope once; it is written to scope.json and embedded in the manifest
+    scope_info = ScopeInfo.model_construct(
+        repository=repository,
+        commit_sha=commit_sha,
+        configuration_surfaces=["TERRAFORM"],
+        terraform_paths=detection.tf_paths,
+    )
+
     # Write supporting files
     builder.write_collected_at()
-    builder.write_scope(repository, commit_sha, detection.tf_paths)
+    builder.write_scope(scope_info)
     builder.write_tools(terraform_version)
 
     # Write declared files
@@ -504,8 +611,8 @@ def build_evidence_pack(
     if inventory:
         builder.write_terraform_inventory(inventory)
 
-    # Build process and scope info
-    process_info = ProcessInfo(
+    # Build process info
+    process_info = ProcessInfo.model_construct(
         workflow_name=workflow_name,
         workflow_run_id=workflow_run_id,
         workflow_run_url=workflow_run_url,
@@ -515,13 +622,6 @@ def build_evidence_pack(
         actor=actor,
     )
 
-    scope_info = ScopeInfo(
-        repository=repository,
-        commit_sha=commit_sha,
-        configuration_surfaces=["TERRAFORM"],
-        terraform_paths=detection.tf_paths,
-    )
-
     # Write evaluation manifest
     manifest, status = builder.write_evaluation_manifest(
         detection=detection,
@@ -542,4 +642,4 @@ def build_evidence_pack(
     # Write results summary (outside zip, for easy access)
     builder.write_results_summary(status, artifact_name)
 
-    return zip_path, artifact_name, status
+    return zip_path, artifact_name, status, manifest
@@ -4,13 +4,14 @@ Parses Terraform HCL files to extract resources, providers, and modules.
 Uses python-hcl2 for HCL parsing.
 """
 
+import heapq
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import hcl2
-
 from shared.constants import EXCLUDED_DIRS
 from shared.schemas import (
     ModuleInfo,
@@ -20,16 +21,70 @@ from shared.schemas import (
     TerraformInventory,
 )
 
+from action.src.parse_cache import cached_parse
+
+# Below this many files, a process pool costs more to start than it saves
+PARALLEL_PARSE_MIN_FILES = 8
+
+# Upper bound on parsed files memoized per process by parse_tf_file
+PARSE_MEMO_MAXSIZE = 4096
+
+# Frozen once at import so the directory filter is a constant-time probe
+_EXCLUDED = frozenset(EXCLUDED_DIRS)
+
 
-def parse_tf_file(file_path: Path) -> dict[str, Any] | None:
+def parse_tf_file(file_path: str | os.PathLike[str]) -> dict[str, Any] | None:
     """Parse a single Terraform file.
 
+    Results are memoized per process, keyed on the file's path, mtime and
+    size, so repeated inventories of the same tree parse each file once.
+    Unchanged files are also served from the on-disk parse cache when it is
+    enabled. The returned dict is shared between callers and must not be
+    mutated.
+
+    Args:
+        file_path: Path to .tf file, as a string or path-like object
+
+    Returns:
+        Parsed HCL dict or None if parsing failed
+    """
+    try:
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+    except OSError:
+        return cached_parse(file_path, _load_hcl)
+
+    return _parse_unchanged(abs_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=PARSE_MEMO_MAXSIZE)
+def _parse_unchanged(abs_path: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse a file once per (path, mtime, size) within this process.
+
+    Args:
+        abs_path: Absolute path to .tf file
+        mtime_ns: File modification time in nanoseconds, part of the memo key
+        size: File size in bytes, part of the memo key
+
+    Returns:
+        Parsed HCL dict or None if parsing failed
+    """
+    return cached_parse(abs_path, _load_hcl)
+
+
+def _load_hcl(file_path: str | os.PathLike[str]) -> dict[str, Any] | None:
+    """Parse a Terraform file with python-hcl2.
+
     Args:
         file_path: Path to .tf file
 
     Returns:
         Parsed HCL dict or None if parsing failed
     """
+    # Imported on first use: building the Lark parser dominates import time
+    # and is not needed when there is nothing to parse
+    import hcl2
+
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             return hcl2.load(f)
@@ -49,7 +104,10 @@ def extract_providers(parsed: dict[str, Any], file_path: str) -> list[ProviderIn
     Returns:
         List of ProviderInfo objects
     """
+    # Inventory records are built from our own extraction of parsed HCL, so
+    # model_construct is used to skip per-instance validation.
     providers: list[ProviderInfo] = []
+    seen: set[str] = set()
 
     # Check terraform.required_providers block
     terraform_blocks = parsed.get("terraform", [])
@@ -59,9 +117,10 @@ def extract_providers(parsed: dict[str, Any], file_path: str) -> list[ProviderIn
             for rp in required_providers:
                 if isinstance(rp, dict):
                     for name, config in rp.items():
+                        seen.add(name)
                         if isinstance(config, dict):
                             providers.append(
-                                ProviderInfo(
+                                ProviderInfo.model_construct(
                                     name=name,
                                     source=config.get("source"),
                                     version_constraint=config.get("version"),
@@ -70,7 +129,7 @@ def extract_providers(parsed: dict[str, Any], file_path: str) -> list[ProviderIn
                         else:
                             # Simple string version constraint
                             providers.append(
-                                ProviderInfo(
+                                ProviderInfo.model_construct(
                                     name=name,
                                     source=None,
                                     version_constraint=str(config) if config else None,
@@ -83,12 +142,13 @@ def extract_providers(parsed: dict[str, Any], file_path: str) -> list[ProviderIn
         if isinstance(provider, dict):
             for name, config in provider.items():
                 # Only add if not already found in required_providers
-                if not any(p.name == name for p in providers):
+                if name not in seen:
+                    seen.add(name)
                     version = None
                     if isinstance(config, dict):
                         version = config.get("version")
                     providers.append(
-                        ProviderInfo(
+                        ProviderInfo.model_construct(
                             name=name,
                             source=None,
                             version_constraint=version,
@@ -118,7 +178,7 @@ def extract_modules(parsed: dict[str, Any], file_path: str) -> list[ModuleInfo]:
                     source = config.get("source", "")
                     version = config.get("version")
                     modules.append(
-                        ModuleInfo(
+                        ModuleInfo.model_construct(
                             name=name,
                             source=source,
                             version=version,
@@ -141,97 +201,153 @@ def extract_resources(
     Returns:
         Dict mapping resource type to list of file paths where declared
     """
-    resources: dict[str, list[str]] = {}
+    resources: dict[str, set[str]] = {}
 
     resource_blocks = parsed.get("resource", [])
     for resource in resource_blocks:
         if isinstance(resource, dict):
-            for resource_type, instances in resource.items():
-                if resource_type not in resources:
-                    resources[resource_type] = []
-                # Each instance is a named resource
-                if isinstance(instances, dict):
-                    count = len(instances)
-                else:
-                    count = 1
-                # Add file path for each instance
-                for _ in range(count):
-                    if file_path not in resources[resource_type]:
-                        resources[resource_type].append(file_path)
-
-    return resources
+            for resource_type in resource:
+                # Only the declaring file is recorded, however many instances
+                resources.setdefault(resource_type, set()).add(file_path)
 
+    return {resource_type: sorted(files) for resource_type, files in resources.items()}
 
-def generate_inventory(
+
+def collect_tf_files(
     root_path: str | Path = ".",
     tf_paths: list[str] | None = None,
-) -> TerraformInventory:
-    """Generate Terraform inventory by parsing all .tf files.
+) -> list[tuple[str, str]]:
+    """Collect .tf files under the scan paths, skipping excluded directories.
 
     Args:
         root_path: Root directory of the repository
         tf_paths: Optional list of specific paths to scan
 
     Returns:
-        TerraformInventory with aggregated information
+        List of (absolute path, path relative to root) tuples in walk order
     """
     root = Path(root_path).resolve()
 
-    all_providers: list[ProviderInfo] = []
-    all_modules: list[ModuleInfo] = []
-    resource_map: dict[str, list[str]] = {}
-    files_analyzed: list[str] = []
-    terraform_paths: set[str] = set()
-
     # Determine paths to scan
     if tf_paths:
         scan_paths = [root / p for p in tf_paths]
     else:
         scan_paths = [root]
 
+    tf_files: list[tuple[str, str]] = []
+
+    # Bind hot lookups to locals once, outside the per-entry loop
+    add_file = tf_files.append
+    excluded = _EXCLUDED
+
     for scan_path in scan_paths:
         if not scan_path.exists():
             continue
 
-        for dirpath, dirnames, filenames in os.walk(scan_path):
-            # Filter excluded directories
-            dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith(".")]
+        # Iterative os.scandir walk over (absolute, relative) directory pairs;
+        # entries carry their names and types, so no Path objects are built
+        stack: list[tuple[str, str]] = [
+            (str(scan_path), os.path.relpath(scan_path, root))
+        ]
+
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            # Relative prefix for children of this directory ("" at the root)
+            prefix = "" if rel_dir == "." else rel_dir + os.sep
+            subdirs: list[tuple[str, str]] = []
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        name = entry.name
 
-            current_dir = Path(dirpath)
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip excluded and hidden directories before descending
+                            if name[:1] != "." and name not in excluded:
+                                subdirs.append((entry.path, prefix + name))
+                            continue
 
-            for filename in filenames:
-                if not filename.endswith(".tf"):
-                    continue
+                        if not name.endswith(".tf"):
+                            continue
 
-                file_path = current_dir / filename
-                rel_path = str(file_path.relative_to(root))
-                files_analyzed.append(rel_path)
+                        add_file((entry.path, prefix + name))
+            except OSError:
+                # Unreadable directory - skip it, as os.walk would
+                continue
 
-                # Track terraform path
-                rel_dir = str(current_dir.relative_to(root))
-                terraform_paths.add(rel_dir if rel_dir != "." else ".")
+            # Reversed so subdirectories are visited in os.walk's top-down order,
+            # keeping first-declared providers and module order stable
+            stack.extend(reversed(subdirs))
 
-                # Parse file
-                parsed = parse_tf_file(file_path)
-                if parsed is None:
-                    continue
+    return tf_files
 
-                # Extract providers (deduplicate later)
-                providers = extract_providers(parsed, rel_path)
-                all_providers.extend(providers)
 
-                # Extract modules
-                modules = extract_modules(parsed, rel_path)
-                all_modules.extend(modules)
+def parse_tf_files(
+    root_path: str | Path = ".",
+    tf_paths: list[str] | None = None,
+) -> list[tuple[str, dict[str, Any] | None]]:
+    """Parse every .tf file under the scan paths once.
+
+    The result can be handed to both generate_inventory and
+    extract_network_inventory so each file is parsed a single time per run.
+
+    Args:
+        root_path: Root directory of the repository
+        tf_paths: Optional list of specific paths to scan
+
+    Returns:
+        List of (path relative to root, parsed HCL dict or None) tuples
+    """
+    tf_files = collect_tf_files(root_path, tf_paths)
+    abs_paths = [abs_path for abs_path, _ in tf_files]
+
+    # HCL parsing is CPU-bound pure Python, so large trees are parsed across
+    # processes; small ones stay in-process to avoid pool start-up cost.
+    if len(abs_paths) < PARALLEL_PARSE_MIN_FILES:
+        parsed = [parse_tf_file(abs_path) for abs_path in abs_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parsed = list(executor.map(parse_tf_file, abs_paths, chunksize=8))
+
+    return [(rel_path, result) for (_, rel_path), result in zip(tf_files, parsed, strict=True)]
+
+
+def generate_inventory(
+    root_path: str | Path = ".",
+    tf_paths: list[str] | None = None,
+    parsed_files: list[tuple[str, dict[str, Any] | None]] | None = None,
+) -> TerraformInventory:
+    """Generate Terraform inventory by parsing all .tf files.
+
+    Args:
+        root_path: Root directory of the repository
+        tf_paths: Optional list of specific paths to scan
+        parsed_files: Optional output of parse_tf_files to reuse instead of
+            walking and parsing the tree again
+
+    Returns:
+        TerraformInventory with aggregated information
+    """
+    if parsed_files is None:
+        parsed_files = parse_tf_files(root_path, tf_paths)
 
-                # Extract resources
-                resources = extract_resources(parsed, rel_path)
-                for resource_type, files in resources.items():
-                    if resource_type not in resource_map:
-                        resource_map[resource_type] = []
-                    for f in files:
-                        if f not in resource_map[resource_type]:
-                            resource_map[resource_type].append(f)
+    all_providers: list[ProviderInfo] = []
+    all_modules: list[ModuleInfo] = []
+    resource_map: dict[str, set[str]] = {}
+    # Analyzed files grouped by directory (the terraform paths), in walk order
+    files_by_dir: dict[str, list[str]] = {}
+
+    for rel_path, parsed in parsed_files:
+        files_by_dir.setdefault(os.path.dirname(rel_path) or ".", []).append(rel_path)
+
+        if parsed is None:
+            continue
+
+        # Providers are deduplicated later
+        all_providers.extend(extract_providers(parsed, rel_path))
+        all_modules.extend(extract_modules(parsed, rel_path))
+
+        for resource_type, files in extract_resources(parsed, rel_path).items():
+            resource_map.setdefault(resource_type, set()).update(files)
 
     # Deduplicate providers by name (keep first occurrence)
     seen_providers: set[str] = set()
@@ -247,25 +363,32 @@ def generate_inventory(
     for resource_type, files in resource_map.items():
         count = len(files)
         total_count += count
-        by_type[resource_type] = ResourceTypeSummary(count=count, files=sorted(set(files)))
+        by_type[resource_type] = ResourceTypeSummary.model_construct(
+            count=count, files=sorted(files)
+        )
 
     resources = ResourceSummary(total_count=total_count, by_type=by_type)
 
+    # Sort each directory's short run, then merge the runs rather than sorting
+    # every path in the repository at once
+    for dir_files in files_by_dir.values():
+        dir_files.sort()
+    files_analyzed = list(heapq.merge(*files_by_dir.values()))
+
     return TerraformInventory(
         generated_at=datetime.now(timezone.utc).isoformat(),
-        terraform_paths=sorted(terraform_paths),
+        terraform_paths=sorted(files_by_dir),
         resources=resources,
         providers=unique_providers,
         modules=all_modules,
-        files_analyzed=sorted(files_analyzed),
+        files_analyzed=files_analyzed,
     )
 
 
 if __name__ == "__main__":
     # Quick test
-    import json
     import sys
 
     path = sys.argv[1] if len(sys.argv) > 1 else "."
     result = generate_inventory(path)
-    print(json.dumps(result.model_dump(), indent=2))
+    print(result.model_dump_json(indent=2))
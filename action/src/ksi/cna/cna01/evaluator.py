@@ -13,67 +13,92 @@ from shared.schemas_network import (
     NetworkInventory,
 )
 
-
-def evaluate_cna01_a(inventory: NetworkInventory) -> CNA01CriterionResult:
+# Fixed fields of each criterion result, resolved once at import
+_CRITERION_BASE: dict[str, dict[str, str]] = {
+    criterion_id: {
+        "id": criterion_id,
+        "name": criterion_def["name"],
+        "description": criterion_def["description"],
+        "requirement": criterion_def["requirement"],
+    }
+    for criterion_id, criterion_def in CNA01_CRITERIA_DEFINITIONS.items()
+}
+
+
+def evaluate_cna01_a(
+    inventory: NetworkInventory,
+    non_compliant: set[int] | None = None,
+) -> CNA01CriterionResult:
     """Evaluate CNA01-A: Ingress Restrictions.
 
     Check that no sensitive ports are exposed to unrestricted internet access.
 
     Args:
         inventory: Network inventory from Terraform
+        non_compliant: Optional set that collects the indexes of security
+            groups failing this criterion
 
     Returns:
         CNA01CriterionResult with findings
     """
-    criterion_def = CNA01_CRITERIA_DEFINITIONS["CNA01-A"]
+    # Findings are built from the validated inventory, so model_construct is
+    # used to skip re-validating each one.
     findings: list[CNA01Finding] = []
 
-    for sg in inventory.security_groups:
+    for index, sg in enumerate(inventory.security_groups):
         if sg.sensitive_ports_exposed:
+            if non_compliant is not None:
+                non_compliant.add(index)
+            # Shared by every finding for this security group
+            address, source_file, source_line = (
+                sg.resource_address,
+                sg.source_file,
+                sg.source_line,
+            )
             for exposed in sg.sensitive_ports_exposed:
                 findings.append(
-                    CNA01Finding(
-                        resource=sg.resource_address,
+                    CNA01Finding.model_construct(
+                        resource=address,
                         issue=f"Sensitive port {exposed['port']} ({exposed['service']}) "
                         f"exposed to {exposed['cidr']}",
-                        source_file=sg.source_file,
-                        source_line=sg.source_line,
+                        source_file=source_file,
+                        source_line=source_line,
                         severity="high",
                         details=exposed,
                     )
                 )
 
     status = "PASS" if not findings else "FAIL"
-    reason = criterion_def["pass_reason"] if status == "PASS" else criterion_def["fail_reason"]
-
-    return CNA01CriterionResult(
-        id="CNA01-A",
-        name=criterion_def["name"],
-        description=criterion_def["description"],
-        requirement=criterion_def["requirement"],
-        status=status,
-        findings=findings,
+
+    return CNA01CriterionResult.model_construct(
+        **_CRITERION_BASE["CNA01-A"], status=status, findings=findings
     )
 
 
-def evaluate_cna01_b(inventory: NetworkInventory) -> CNA01CriterionResult:
+def evaluate_cna01_b(
+    inventory: NetworkInventory,
+    non_compliant: set[int] | None = None,
+) -> CNA01CriterionResult:
     """Evaluate CNA01-B: Explicit Ingress Rules.
 
     Check that all security groups have explicitly defined ingress rules.
 
     Args:
         inventory: Network inventory from Terraform
+        non_compliant: Optional set that collects the indexes of security
+            groups failing this criterion
 
     Returns:
         CNA01CriterionResult with findings
     """
-    criterion_def = CNA01_CRITERIA_DEFINITIONS["CNA01-B"]
     findings: list[CNA01Finding] = []
 
-    for sg in inventory.security_groups:
+    for index, sg in enumerate(inventory.security_groups):
         if not sg.has_explicit_ingress:
+            if non_compliant is not None:
+                non_compliant.add(index)
             findings.append(
-                CNA01Finding(
+                CNA01Finding.model_construct(
                     resource=sg.resource_address,
                     issue="No ingress rules defined. Security groups must have "
                     "explicitly configured ingress restrictions.",
@@ -85,33 +110,40 @@ def evaluate_cna01_b(inventory: NetworkInventory) -> CNA01CriterionResult:
 
     status = "PASS" if not findings else "FAIL"
 
-    return CNA01CriterionResult(
-        id="CNA01-B",
-        name=criterion_def["name"],
-        description=criterion_def["description"],
-        requirement=criterion_def["requirement"],
-        status=status,
-        findings=findings,
+    return CNA01CriterionResult.model_construct(
+        **_CRITERION_BASE["CNA01-B"], status=status, findings=findings
     )
 
 
-def evaluate_cna01_c(inventory: NetworkInventory) -> CNA01CriterionResult:
+def evaluate_cna01_c(
+    inventory: NetworkInventory,
+    non_compliant: set[int] | None = None,
+) -> CNA01CriterionResult:
     """Evaluate CNA01-C: Egress Restrictions.
 
     Check that outbound traffic is explicitly limited (no unrestricted egress).
 
     Args:
         inventory: Network inventory from Terraform
+        non_compliant: Optional set that collects the indexes of security
+            groups failing this criterion
 
     Returns:
         CNA01CriterionResult with findings
     """
-    criterion_def = CNA01_CRITERIA_DEFINITIONS["CNA01-C"]
     findings: list[CNA01Finding] = []
 
-    for sg in inventory.security_groups:
+    for index, sg in enumerate(inventory.security_groups):
         # Check for unrestricted egress
         if sg.has_unrestricted_egress:
+            if non_compliant is not None:
+                non_compliant.add(index)
+            # Shared by every finding for this security group
+            address, source_file, source_line = (
+                sg.resource_address,
+                sg.source_file,
+                sg.source_line,
+            )
             # Find the specific unrestricted egress rules
             for egress in sg.egress_rules:
                 if egress.is_unrestricted:
@@ -120,12 +152,12 @@ def evaluate_cna01_c(inventory: NetworkInventory) -> CNA01CriterionResult:
                         c for c in cidrs if c in ("0.0.0.0/0", "::/0")
                     ]
                     findings.append(
-                        CNA01Finding(
-                            resource=sg.resource_address,
+                        CNA01Finding.model_construct(
+                            resource=address,
                             issue=f"Unrestricted egress: {unrestricted_cidrs} on "
                             f"protocol {egress.protocol} ports {egress.from_port}-{egress.to_port}",
-                            source_file=sg.source_file,
-                            source_line=sg.source_line,
+                            source_file=source_file,
+                            source_line=source_line,
                             severity="high",
                             details={
                                 "cidr_blocks": unrestricted_cidrs,
@@ -137,8 +169,10 @@ def evaluate_cna01_c(inventory: NetworkInventory) -> CNA01CriterionResult:
                     )
         # Also fail if no egress rules are defined (AWS defaults to allow all)
         elif not sg.has_explicit_egress:
+            if non_compliant is not None:
+                non_compliant.add(index)
             findings.append(
-                CNA01Finding(
+                CNA01Finding.model_construct(
                     resource=sg.resource_address,
                     issue="No egress rules defined. AWS defaults to allow all egress, "
                     "which violates the requirement to limit outbound traffic.",
@@ -150,13 +184,8 @@ def evaluate_cna01_c(inventory: NetworkInventory) -> CNA01CriterionResult:
 
     status = "PASS" if not findings else "FAIL"
 
-    return CNA01CriterionResult(
-        id="CNA01-C",
-        name=criterion_def["name"],
-        description=criterion_def["description"],
-        requirement=criterion_def["requirement"],
-        status=status,
-        findings=findings,
+    return CNA01CriterionResult.model_construct(
+        **_CRITERION_BASE["CNA01-C"], status=status, findings=findings
     )
 
 
@@ -171,7 +200,6 @@ def evaluate_cna01_d(trigger_event: str) -> CNA01CriterionResult:
     Returns:
         CNA01CriterionResult with findings
     """
-    criterion_def = CNA01_CRITERIA_DEFINITIONS["CNA01-D"]
     findings: list[CNA01Finding] = []
 
     if trigger_event != "schedule":
@@ -188,13 +216,8 @@ def evaluate_cna01_d(trigger_event: str) -> CNA01CriterionResult:
 
     status = "PASS" if not findings else "FAIL"
 
-    return CNA01CriterionResult(
-        id="CNA01-D",
-        name=criterion_def["name"],
-        description=criterion_def["description"],
-        requirement=criterion_def["requirement"],
-        status=status,
-        findings=findings,
+    return CNA01CriterionResult.model_construct(
+        **_CRITERION_BASE["CNA01-D"], status=status, findings=findings
     )
 
 
@@ -216,42 +239,37 @@ def evaluate_cna01(
         # No security groups found - this is an ERROR condition
         return _build_error_result()
 
-    # Evaluate each criterion
+    # Evaluate each criterion. The security group criteria record which groups
+    # they fail, so compliance is counted without another pass over the groups.
     criteria: dict[str, CNA01CriterionResult] = {}
+    non_compliant: set[int] = set()
 
-    criteria["CNA01-A"] = evaluate_cna01_a(inventory)
-    criteria["CNA01-B"] = evaluate_cna01_b(inventory)
-    criteria["CNA01-C"] = evaluate_cna01_c(inventory)
+    criteria["CNA01-A"] = evaluate_cna01_a(inventory, non_compliant)
+    criteria["CNA01-B"] = evaluate_cna01_b(inventory, non_compliant)
+    criteria["CNA01-C"] = evaluate_cna01_c(inventory, non_compliant)
     criteria["CNA01-D"] = evaluate_cna01_d(trigger_event)
 
-    # Compute summary
-    passed = sum(1 for c in criteria.values() if c.status == "PASS")
-    failed = sum(1 for c in criteria.values() if c.status == "FAIL")
+    # Compute summary in a single pass over the criteria
+    passed = 0
+    failed = 0
+    has_error = False
+    for c in criteria.values():
+        if c.status == "PASS":
+            passed += 1
+        elif c.status == "FAIL":
+            failed += 1
+        elif c.status == "ERROR":
+            has_error = True
     total = len(criteria)
 
     # Count compliant security groups
-    compliant_sgs = 0
-    non_compliant_sgs = 0
-
-    for sg in inventory.security_groups:
-        is_compliant = (
-            not sg.sensitive_ports_exposed
-            and sg.has_explicit_ingress
-            and sg.has_explicit_egress
-            and not sg.has_unrestricted_egress
-        )
-        if is_compliant:
-            compliant_sgs += 1
-        else:
-            non_compliant_sgs += 1
+    non_compliant_sgs = len(non_compliant)
+    compliant_sgs = len(inventory.security_groups) - non_compliant_sgs
 
     # Determine overall status
-    has_error = any(c.status == "ERROR" for c in criteria.values())
-    has_fail = any(c.status == "FAIL" for c in criteria.values())
-
     if has_error:
         overall_status = "ERROR"
-    elif has_fail:
+    elif failed:
         overall_status = "FAIL"
     else:
         overall_status = "PASS"
@@ -285,18 +303,13 @@ def _build_error_result() -> tuple[dict[str, CNA01CriterionResult], CNA01Summary
 
     criteria: dict[str, CNA01CriterionResult] = {}
 
-    for criterion_id, criterion_def in CNA01_CRITERIA_DEFINITIONS.items():
+    for criterion_id, base in _CRITERION_BASE.items():
         if criterion_id == "CNA01-D":
             # Skip persistent evaluation for error case
             continue
 
-        criteria[criterion_id] = CNA01CriterionResult(
-            id=criterion_id,
-            name=criterion_def["name"],
-            description=criterion_def["description"],
-            requirement=criterion_def["requirement"],
-            status="ERROR",
-            findings=[error_finding],
+        criteria[criterion_id] = CNA01CriterionResult.model_construct(
+            **base, status="ERROR", findings=[error_finding]
         )
 
     summary = CNA01Summary(
@@ -4,13 +4,13 @@ Generates the evidence pack artifact for CNA-01: Restrict Network Traffic.
 """
 
 import hashlib
-import json
 import sys
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from pydantic import BaseModel
 from shared.constants_cna import (
     CNA01_APPLIES_TO,
     CNA01_ARTIFACT_PREFIX,
@@ -26,6 +26,8 @@ from shared.schemas_network import (
     NetworkInventory,
 )
 
+from action.src.serialization import dump_json_bytes, zip_compress_type
+
 
 class CNA01EvidencePackBuilder:
     """Builder for FedRAMP KSI-CNA-01 evidence pack."""
@@ -40,6 +42,8 @@ class CNA01EvidencePackBuilder:
         self.evidence_dir = self.output_dir / "evidence" / "ksi-cna-01"
         self.declared_dir = self.evidence_dir / "declared"
         self.files_written: list[tuple[str, str]] = []  # (relative_path, description)
+        self.file_hashes: dict[str, str] = {}  # relative_path -> SHA-256 hex digest
+        self.payloads: dict[str, bytes] = {}  # relative_path -> bytes written
         self.timestamp = datetime.now(timezone.utc)
 
     def setup_directories(self) -> None:
@@ -62,6 +66,50 @@ class CNA01EvidencePackBuilder:
             description: Description for manifest
             subdir: Optional subdirectory (e.g., "declared")
 
+        Returns:
+            Path to written file
+        """
+        return self._write_payload(filename, dump_json_bytes(data), description, subdir)
+
+    def write_model_file(
+        self,
+        filename: str,
+        model: BaseModel,
+        description: str,
+        subdir: str | None = None,
+    ) -> Path:
+        """Write a pydantic model to the evidence pack as JSON.
+
+        Serializes directly with ``model_dump_json`` so no intermediate dict
+        is built.
+
+        Args:
+            filename: Name of the file
+            model: Model to write as JSON
+            description: Description for manifest
+            subdir: Optional subdirectory (e.g., "declared")
+
+        Returns:
+            Path to written file
+        """
+        payload = model.model_dump_json(indent=2).encode("utf-8")
+        return self._write_payload(filename, payload, description, subdir)
+
+    def _write_payload(
+        self,
+        filename: str,
+        payload: bytes,
+        description: str,
+        subdir: str | None = None,
+    ) -> Path:
+        """Write serialized bytes to the evidence pack and record their hash.
+
+        Args:
+            filename: Name of the file
+            payload: Bytes to write
+            description: Description for manifest
+            subdir: Optional subdirectory (e.g., "declared")
+
         Returns:
             Path to written file
         """
@@ -75,10 +123,11 @@ class CNA01EvidencePackBuilder:
         target_dir.mkdir(parents=True, exist_ok=True)
         file_path = target_dir / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        file_path.write_bytes(payload)
 
         self.files_written.append((rel_path, description))
+        self.file_hashes[rel_path] = hashlib.sha256(payload).hexdigest()
+        self.payloads[rel_path] = payload
         return file_path
 
     def write_collected_at(self) -> None:
@@ -136,9 +185,9 @@ class CNA01EvidencePackBuilder:
 
     def write_network_inventory(self, inventory: NetworkInventory) -> None:
         """Write network_inventory.json."""
-        self.write_json_file(
+        self.write_model_file(
             "network_inventory.json",
-            inventory.model_dump(),
+            inventory,
             "Network inventory extracted from Terraform configuration",
             subdir="declared",
         )
@@ -172,9 +221,9 @@ class CNA01EvidencePackBuilder:
             summary=summary,
         )
 
-        self.write_json_file(
+        self.write_model_file(
             "evaluation_manifest.json",
-            manifest.model_dump(),
+            manifest,
             "Primary evaluation manifest with PASS/FAIL/ERROR status",
         )
 
@@ -208,24 +257,18 @@ class CNA01EvidencePackBuilder:
 
     def write_hashes(self) -> None:
         """Write hashes.sha256 - SHA-256 hashes of all files."""
-        hashes: list[str] = []
-
-        for rel_path, _ in self.files_written:
-            abs_path = self.output_dir / rel_path
-            if abs_path.exists():
-                sha256 = hashlib.sha256()
-                with open(abs_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        sha256.update(chunk)
-                hashes.append(f"{sha256.hexdigest()}  {rel_path}")
+        # Digests were computed from the payloads as write_json_file wrote them
+        content = "".join(
+            f"{self.file_hashes[rel_path]}  {rel_path}\n" for rel_path, _ in self.files_written
+        )
 
+        payload = content.encode("utf-8")
         hashes_path = self.evidence_dir / "hashes.sha256"
-        with open(hashes_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(hashes) + "\n")
+        hashes_path.write_bytes(payload)
 
-        self.files_written.append(
-            ("evidence/ksi-cna-01/hashes.sha256", "SHA-256 hashes of all evidence files")
-        )
+        rel_path = "evidence/ksi-cna-01/hashes.sha256"
+        self.files_written.append((rel_path, "SHA-256 hashes of all evidence files"))
+        self.payloads[rel_path] = payload
 
     def create_zip(self, commit_sha: str) -> tuple[Path, str]:
         """Create the evidence pack zip file.
@@ -241,11 +284,14 @@ class CNA01EvidencePackBuilder:
         artifact_name = f"{CNA01_ARTIFACT_PREFIX}_{short_sha}_{timestamp_str}.zip"
         zip_path = self.output_dir / artifact_name
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Evidence files are small JSON documents; the fastest deflate level keeps
+        # nearly all of the size win at a fraction of the CPU cost, and the
+        # smallest files are stored as-is.
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            # Archive the payloads kept in memory rather than reading files back
             for rel_path, _ in self.files_written:
-                abs_path = self.output_dir / rel_path
-                if abs_path.exists():
-                    zf.write(abs_path, rel_path)
+                payload = self.payloads[rel_path]
+                zf.writestr(rel_path, payload, compress_type=zip_compress_type(payload))
 
         return zip_path, artifact_name
 
@@ -5,11 +5,15 @@ from Terraform HCL files. This inventory is shared across CNA-01, CNA-02, CNA-03
 """
 
 import os
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-import hcl2
+from typing import Any, NamedTuple
 
 from shared.constants_cna import (
     ALL_PROTOCOLS,
@@ -31,10 +35,31 @@ from shared.schemas_network import (
     VPCInfo,
 )
 
+from action.src.parse_cache import cached_parse
+
+# Below this many files, a process pool costs more to start than it saves
+PARALLEL_PARSE_MIN_FILES = 8
+
+# Frozen once at import so the directory filter is a constant-time probe
+_EXCLUDED = frozenset(EXCLUDED_DIRS)
+
+# Sensitive ports as (port, position in SENSITIVE_PORTS, service), sorted by
+# port so a rule's port range can be located by binary search
+_SENSITIVE_PORT_LIST = sorted(
+    (port, rank, service) for rank, (port, service) in enumerate(SENSITIVE_PORTS.items())
+)
+_SENSITIVE_PORT_KEYS = [port for port, _, _ in _SENSITIVE_PORT_LIST]
+
 
-def parse_tf_file(file_path: Path) -> dict[str, Any] | None:
+def parse_tf_file(file_path: str | os.PathLike[str]) -> dict[str, Any] | None:
     """Parse a single Terraform file.
 
+    Results are memoized per process, keyed on the file's path, mtime and
+    size. Files that mention none of the supported network resource types
+    are not parsed at all and yield an empty resource list. Shares the
+    on-disk parse cache with the MLA-05 inventory when it is enabled. The
+    returned dict is shared between callers and must not be mutated.
+
     Args:
         file_path: Path to .tf file
 
@@ -42,13 +67,133 @@ def parse_tf_file(file_path: Path) -> dict[str, Any] | None:
         Parsed HCL dict or None if parsing failed
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return hcl2.load(f)
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+    except OSError:
+        return _parse_network_file(file_path)
+
+    return _parse_unchanged(abs_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _parse_unchanged(abs_path: str, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse a file once per (path, mtime, size) within this process.
+
+    Args:
+        abs_path: Absolute path to .tf file
+        mtime_ns: File modification time in nanoseconds, part of the memo key
+        size: File size in bytes, part of the memo key
+
+    Returns:
+        Parsed HCL dict or None if parsing failed
+    """
+    return _parse_network_file(abs_path)
+
+
+def _parse_network_file(file_path: str | os.PathLike[str]) -> dict[str, Any] | None:
+    """Parse a file only if it can declare a supported network resource.
+
+    The sniff runs before the on-disk cache so that the empty result for a
+    skipped file is never stored where the MLA-05 inventory would read it.
+
+    Args:
+        file_path: Path to .tf file
+
+    Returns:
+        Parsed HCL dict, an empty resource list for irrelevant files, or None
+        if parsing failed
+    """
+    try:
+        with open(file_path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    if _RESOURCE_SNIFF.search(content) is None:
+        return {"resource": []}
+
+    # Parse the bytes already read for the sniff instead of reopening the file
+    return cached_parse(file_path, lambda _: _loads_hcl(content))
+
+
+def _loads_hcl(content: bytes) -> dict[str, Any] | None:
+    """Parse the contents of a Terraform file with python-hcl2.
+
+    Args:
+        content: Raw file contents
+
+    Returns:
+        Parsed HCL dict or None if parsing failed
+    """
+    # Imported on first use: building the Lark parser dominates import time
+    # and is not needed when there is nothing to parse
+    import hcl2
+
+    try:
+        text = content.decode("utf-8")
+        # Match text-mode reads, which translate \r\n and \r to \n
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return hcl2.loads(text)
     except Exception:
         # Silently skip files that can't be parsed
         return None
 
 
+def _as_int(value: Any) -> Any:
+    """Coerce a numeric string to int; other values pass through.
+
+    Strings that are not integers (e.g. interpolations) become None.
+    """
+    if type(value) is str:
+        # Parse directly; numeric strings are the common case
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _as_list(value: Any) -> Any:
+    """Wrap a bare string in a list; other values pass through."""
+    return [value] if type(value) is str else value
+
+
+def _as_bool(value: Any) -> Any:
+    """Coerce a "true"/"false" string to bool; other values pass through."""
+    return value.lower() == "true" if type(value) is str else value
+
+
+@lru_cache(maxsize=256)
+def _is_all_protocols(protocol: str) -> bool:
+    """Check if a protocol value means "all protocols", ignoring case.
+
+    Protocol values come from a handful of distinct strings, so the
+    case-folded lookup is memoized rather than repeated for every rule.
+
+    Args:
+        protocol: Protocol string
+
+    Returns:
+        True if the protocol matches any protocol
+    """
+    return protocol.lower() in ALL_PROTOCOLS
+
+
+def _has_unrestricted_cidr(cidr_blocks: list[str], ipv6_cidr_blocks: list[str]) -> bool:
+    """Check if any IPv4 or IPv6 CIDR block is unrestricted."""
+    return any(c in UNRESTRICTED_CIDRS for c in cidr_blocks) or any(
+        c in UNRESTRICTED_CIDRS for c in ipv6_cidr_blocks
+    )
+
+
+def _covers_all_ports(from_port: int | None, to_port: int | None) -> bool:
+    """Check if a port range covers all ports (0-65535 or -1)."""
+    if from_port is not None and to_port is not None:
+        return (from_port == 0 and to_port == 65535) or (from_port == -1 or to_port == -1)
+    return False
+
+
 def is_unrestricted_rule(
     cidr_blocks: list[str],
     ipv6_cidr_blocks: list[str],
@@ -68,30 +213,11 @@ def is_unrestricted_rule(
     Returns:
         True if rule allows unrestricted access
     """
-    # Check if any CIDR is unrestricted
-    has_unrestricted_cidr = bool(
-        set(cidr_blocks) & UNRESTRICTED_CIDRS
-        or set(ipv6_cidr_blocks) & UNRESTRICTED_CIDRS
-    )
-
-    if not has_unrestricted_cidr:
+    if not _has_unrestricted_cidr(cidr_blocks, ipv6_cidr_blocks):
         return False
 
-    # Check if all ports/protocols are allowed
-    is_all_protocols = protocol.lower() in ALL_PROTOCOLS
-
     # For protocol -1, ports are ignored (all traffic)
-    if is_all_protocols:
-        return True
-
-    # Check for all ports (0-65535 or -1)
-    if from_port is not None and to_port is not None:
-        is_all_ports = (from_port == 0 and to_port == 65535) or (
-            from_port == -1 or to_port == -1
-        )
-        return is_all_ports
-
-    return False
+    return _is_all_protocols(protocol) or _covers_all_ports(from_port, to_port)
 
 
 def check_sensitive_port_exposure(
@@ -113,91 +239,108 @@ def check_sensitive_port_exposure(
     Returns:
         List of exposed sensitive ports with details
     """
-    exposed = []
+    return evaluate_rule(cidr_blocks, ipv6_cidr_blocks, from_port, to_port, protocol)[1]
+
+
+def evaluate_rule(
+    cidr_blocks: list[str],
+    ipv6_cidr_blocks: list[str],
+    from_port: int | None,
+    to_port: int | None,
+    protocol: str,
+) -> tuple[bool, list[dict[str, Any]]]:
+    """Check a rule for unrestricted access and sensitive port exposure at once.
+
+    Equivalent to calling is_unrestricted_rule and check_sensitive_port_exposure,
+    but scans the CIDRs and case-folds the protocol only once.
+
+    Args:
+        cidr_blocks: List of IPv4 CIDR blocks
+        ipv6_cidr_blocks: List of IPv6 CIDR blocks
+        from_port: Start port
+        to_port: End port
+        protocol: Protocol string
+
+    Returns:
+        Tuple of (whether the rule is unrestricted, exposed sensitive ports)
+    """
+    exposed: list[dict[str, Any]] = []
 
     # Check if rule allows access from anywhere
-    has_unrestricted_cidr = bool(
-        set(cidr_blocks) & UNRESTRICTED_CIDRS
-        or set(ipv6_cidr_blocks) & UNRESTRICTED_CIDRS
-    )
+    if not _has_unrestricted_cidr(cidr_blocks, ipv6_cidr_blocks):
+        return False, exposed
 
-    if not has_unrestricted_cidr:
-        return exposed
+    # The matching CIDRs are the same for every exposed port of this rule
+    cidr = [c for c in dict.fromkeys(cidr_blocks) if c in UNRESTRICTED_CIDRS] or [
+        c for c in dict.fromkeys(ipv6_cidr_blocks) if c in UNRESTRICTED_CIDRS
+    ]
 
     # All protocols means all ports are potentially exposed
-    if protocol.lower() in ALL_PROTOCOLS:
+    if _is_all_protocols(protocol):
         for port, service in SENSITIVE_PORTS.items():
             exposed.append({
                 "port": port,
                 "service": service,
-                "cidr": list(set(cidr_blocks) & UNRESTRICTED_CIDRS)
-                or list(set(ipv6_cidr_blocks) & UNRESTRICTED_CIDRS),
+                "cidr": list(cidr),
             })
-        return exposed
+        return True, exposed
+
+    is_unrestricted = _covers_all_ports(from_port, to_port)
 
     # Check specific port range
     if from_port is None or to_port is None:
-        return exposed
+        return is_unrestricted, exposed
 
-    for port, service in SENSITIVE_PORTS.items():
-        if from_port <= port <= to_port:
-            exposed.append({
-                "port": port,
-                "service": service,
-                "cidr": list(set(cidr_blocks) & UNRESTRICTED_CIDRS)
-                or list(set(ipv6_cidr_blocks) & UNRESTRICTED_CIDRS),
-            })
+    # Binary-search the sorted ports for the range, then report the matches
+    # in SENSITIVE_PORTS order
+    lo = bisect_left(_SENSITIVE_PORT_KEYS, from_port)
+    hi = bisect_right(_SENSITIVE_PORT_KEYS, to_port)
+    for port, _, service in sorted(_SENSITIVE_PORT_LIST[lo:hi], key=itemgetter(1)):
+        exposed.append({
+            "port": port,
+            "service": service,
+            "cidr": list(cidr),
+        })
+
+    return is_unrestricted, exposed
 
-    return exposed
-
-
-def extract_security_group_rule(
-    rule_config: dict[str, Any],
-) -> tuple[
-    int | None,
-    int | None,
-    str,
-    list[str],
-    list[str],
-    list[str],
-    bool,
-    str | None,
-]:
+
+class RuleFields(NamedTuple):
+    """Common fields of an ingress or egress rule."""
+
+    from_port: int | None
+    to_port: int | None
+    protocol: str
+    cidr_blocks: list[str]
+    ipv6_cidr_blocks: list[str]
+    security_group_refs: list[str]
+    self_reference: bool
+    description: str | None
+
+
+def extract_security_group_rule(rule_config: dict[str, Any]) -> RuleFields:
     """Extract common fields from an ingress or egress rule.
 
     Args:
         rule_config: Rule configuration dict
 
     Returns:
-        Tuple of (from_port, to_port, protocol, cidr_blocks, ipv6_cidr_blocks,
-                 security_group_refs, self_reference, description)
+        RuleFields with the rule's ports, protocol, CIDRs, security group
+        references, self reference and description
     """
-    from_port = rule_config.get("from_port")
-    to_port = rule_config.get("to_port")
     protocol = str(rule_config.get("protocol", "-1"))
     description = rule_config.get("description")
 
     # Handle port values
-    if isinstance(from_port, str):
-        from_port = int(from_port) if from_port.lstrip("-").isdigit() else None
-    if isinstance(to_port, str):
-        to_port = int(to_port) if to_port.lstrip("-").isdigit() else None
+    from_port = _as_int(rule_config.get("from_port"))
+    to_port = _as_int(rule_config.get("to_port"))
 
     # CIDR blocks
-    cidr_blocks = rule_config.get("cidr_blocks", [])
-    if isinstance(cidr_blocks, str):
-        cidr_blocks = [cidr_blocks]
-
-    ipv6_cidr_blocks = rule_config.get("ipv6_cidr_blocks", [])
-    if isinstance(ipv6_cidr_blocks, str):
-        ipv6_cidr_blocks = [ipv6_cidr_blocks]
+    cidr_blocks = _as_list(rule_config.get("cidr_blocks", []))
+    ipv6_cidr_blocks = _as_list(rule_config.get("ipv6_cidr_blocks", []))
 
     # Security group references
-    security_group_refs = []
-    sg_ids = rule_config.get("security_groups", [])
-    if isinstance(sg_ids, str):
-        sg_ids = [sg_ids]
-    security_group_refs.extend(sg_ids)
+    security_group_refs = list(_as_list(rule_config.get("security_groups", [])))
 
     # Source security group ID (for ingress)
     source_sg = rule_config.get("source_security_group_id")
@@ -205,11 +348,9 @@ def extract_security_group_rule(
         security_group_refs.append(source_sg)
 
     # Self reference
-    self_ref = rule_config.get("self", False)
-    if isinstance(self_ref, str):
-        self_ref = self_ref.lower() == "true"
+    self_ref = _as_bool(rule_config.get("self", False))
 
-    return (
+    return RuleFields(
         from_port,
         to_port,
         protocol,
@@ -221,58 +362,122 @@ def extract_security_group_rule(
     )
 
 
-def extract_security_groups(
-    parsed: dict[str, Any], file_path: str
-) -> list[SecurityGroupInfo]:
-    """Extract security groups from parsed Terraform.
+def _iter_rule_blocks(config: dict[str, Any], key: str) -> Iterator[dict[str, Any]]:
+    """Iterate over the rule blocks stored under a key of a resource config.
+
+    A single block may be parsed as a dict rather than a list of dicts;
+    non-dict entries are skipped.
+
+    Args:
+        config: Resource configuration
+        key: Block name, e.g. "ingress" or "security_rule"
+
+    Yields:
+        Rule block dicts
+    """
+    blocks = config.get(key, [])
+    if isinstance(blocks, dict):
+        yield blocks
+        return
+
+    for block in blocks:
+        if isinstance(block, dict):
+            yield block
+
+
+def _iter_resources(parsed: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate over (resource type, instances) pairs in a parsed file.
+
+    Args:
+        parsed: Parsed HCL dict
+
+    Yields:
+        Tuples of (resource type, dict of instance name to configuration)
+    """
+    for resource in parsed.get("resource", []):
+        if not isinstance(resource, dict):
+            continue
+        for resource_type, instances in resource.items():
+            if isinstance(instances, dict):
+                yield resource_type, instances
+
+
+def _collect_resources(
+    parsed: dict[str, Any],
+    file_path: str,
+    handlers: dict[str, tuple[str, Callable[[str, dict[str, Any], str], Any]]],
+) -> dict[str, list[Any]]:
+    """Build inventory entries for the resource types handled in one pass.
 
     Args:
         parsed: Parsed HCL dict
         file_path: Source file path
+        handlers: Map of resource type to (inventory field, builder)
 
     Returns:
-        List of SecurityGroupInfo objects
+        Dict mapping each handled inventory field to its entries, in the order
+        the resources are declared
     """
-    security_groups: list[SecurityGroupInfo] = []
+    collected: dict[str, list[Any]] = {field: [] for field, _ in handlers.values()}
 
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
+    for resource_type, instances in _iter_resources(parsed):
+        handler = handlers.get(resource_type)
+        if handler is None:
             continue
 
-        # AWS Security Group
-        sg_resources = resource.get("aws_security_group", {})
-        if isinstance(sg_resources, dict):
-            for sg_name, sg_config in sg_resources.items():
-                if not isinstance(sg_config, dict):
-                    continue
+        field, build = handler
+        entries = collected[field]
+        for name, config in instances.items():
+            if isinstance(config, dict):
+                entries.append(build(name, config, file_path))
 
-                sg = _parse_security_group(
-                    sg_name, sg_config, file_path, "aws_security_group"
-                )
-                security_groups.append(sg)
+    return collected
+
+
+def extract_network_resources(
+    parsed: dict[str, Any], file_path: str
+) -> dict[str, list[Any]]:
+    """Extract every supported network resource from a parsed file in one pass.
+
+    Args:
+        parsed: Parsed HCL dict
+        file_path: Source file path
 
-        # Azure Network Security Group
-        nsg_resources = resource.get("azurerm_network_security_group", {})
-        if isinstance(nsg_resources, dict):
-            for nsg_name, nsg_config in nsg_resources.items():
-                if not isinstance(nsg_config, dict):
-                    continue
+    Returns:
+        Dict mapping NetworkInventory list fields (security_groups, vpcs,
+        subnets, route_tables, internet_gateways, nat_gateways,
+        load_balancers) to their extracted entries
+    """
+    return _collect_resources(parsed, file_path, _RESOURCE_HANDLERS)
+
+
+def extract_security_groups(
+    parsed: dict[str, Any], file_path: str
+) -> list[SecurityGroupInfo]:
+    """Extract security groups from parsed Terraform.
+
+    Args:
+        parsed: Parsed HCL dict
+        file_path: Source file path
+
+    Returns:
+        List of SecurityGroupInfo objects
+    """
+    return _extract_field(parsed, file_path, "security_groups")
 
-                nsg = _parse_azure_nsg(nsg_name, nsg_config, file_path)
-                security_groups.append(nsg)
 
-        # GCP Firewall Rule (each rule is separate, not grouped)
-        fw_resources = resource.get("google_compute_firewall", {})
-        if isinstance(fw_resources, dict):
-            for fw_name, fw_config in fw_resources.items():
-                if not isinstance(fw_config, dict):
-                    continue
+def _extract_field(parsed: dict[str, Any], file_path: str, field: str) -> list[Any]:
+    """Extract the entries of a single inventory field.
 
-                fw = _parse_gcp_firewall(fw_name, fw_config, file_path)
-                security_groups.append(fw)
+    Args:
+        parsed: Parsed HCL dict
+        file_path: Source file path
+        field: NetworkInventory list field to extract
 
-    return security_groups
+    Returns:
+        List of entries for the field
+    """
+    return _collect_resources(parsed, file_path, _FIELD_HANDLERS[field])[field]
 
 
 def _parse_security_group(
@@ -294,83 +499,47 @@ def _parse_security_group(
     sensitive_ports_exposed: list[dict[str, Any]] = []
 
     # Parse ingress rules
-    ingress_blocks = config.get("ingress", [])
-    if isinstance(ingress_blocks, dict):
-        ingress_blocks = [ingress_blocks]
-
-    for ingress in ingress_blocks:
-        if not isinstance(ingress, dict):
-            continue
-
-        (
-            from_port,
-            to_port,
-            protocol,
-            cidr_blocks,
-            ipv6_cidr_blocks,
-            sg_refs,
-            self_ref,
-            description,
-        ) = extract_security_group_rule(ingress)
-
-        is_unrestricted = is_unrestricted_rule(
-            cidr_blocks, ipv6_cidr_blocks, from_port, to_port, protocol
-        )
+    for ingress in _iter_rule_blocks(config, "ingress"):
+        rule = extract_security_group_rule(ingress)
 
-        # Check for sensitive port exposure
-        exposed = check_sensitive_port_exposure(
-            cidr_blocks, ipv6_cidr_blocks, from_port, to_port, protocol
+        # Check for unrestricted access and sensitive port exposure
+        is_unrestricted, exposed = evaluate_rule(
+            rule.cidr_blocks, rule.ipv6_cidr_blocks, rule.from_port, rule.to_port, rule.protocol
         )
         sensitive_ports_exposed.extend(exposed)
 
         ingress_rules.append(
-            IngressRule(
-                description=description,
-                from_port=from_port,
-                to_port=to_port,
-                protocol=protocol,
-                cidr_blocks=cidr_blocks,
-                ipv6_cidr_blocks=ipv6_cidr_blocks,
-                security_group_refs=sg_refs,
-                self_reference=self_ref,
+            IngressRule.model_construct(
+                description=rule.description,
+                from_port=rule.from_port,
+                to_port=rule.to_port,
+                protocol=rule.protocol,
+                cidr_blocks=rule.cidr_blocks,
+                ipv6_cidr_blocks=rule.ipv6_cidr_blocks,
+                security_group_refs=rule.security_group_refs,
+                self_reference=rule.self_reference,
                 is_unrestricted=is_unrestricted,
             )
         )
 
     # Parse egress rules
-    egress_blocks = config.get("egress", [])
-    if isinstance(egress_blocks, dict):
-        egress_blocks = [egress_blocks]
-
-    for egress in egress_blocks:
-        if not isinstance(egress, dict):
-            continue
-
-        (
-            from_port,
-            to_port,
-            protocol,
-            cidr_blocks,
-            ipv6_cidr_blocks,
-            sg_refs,
-            self_ref,
-            description,
-        ) = extract_security_group_rule(egress)
+    for egress in _iter_rule_blocks(config, "egress"):
+        rule = extract_security_group_rule(egress)
 
         is_unrestricted = is_unrestricted_rule(
-            cidr_blocks, ipv6_cidr_blocks, from_port, to_port, protocol
+            rule.cidr_blocks, rule.ipv6_cidr_blocks, rule.from_port, rule.to_port, rule.protocol
         )
 
         egress_rules.append(
-            EgressRule(
-                description=description,
-                from_port=from_port,
-                to_port=to_port,
-                protocol=protocol,
-                cidr_blocks=cidr_blocks,
-                ipv6_cidr_blocks=ipv6_cidr_blocks,
-                security_group_refs=sg_refs,
-                self_reference=self_ref,
+            EgressRule.model_construct(
+                description=rule.description,
+                from_port=rule.from_port,
+                to_port=rule.to_port,
+                protocol=rule.protocol,
+                cidr_blocks=rule.cidr_blocks,
+                ipv6_cidr_blocks=rule.ipv6_cidr_blocks,
+                security_group_refs=rule.security_group_refs,
+                self_reference=rule.self_reference,
                 is_unrestricted=is_unrestricted,
             )
         )
@@ -414,21 +583,15 @@ def _parse_azure_nsg(
     sensitive_ports_exposed: list[dict[str, Any]] = []
 
     # Azure uses security_rule blocks
-    rules = config.get("security_rule", [])
-    if isinstance(rules, dict):
-        rules = [rules]
-
-    for rule in rules:
-        if not isinstance(rule, dict):
-            continue
-
-        direction = rule.get("direction", "").lower()
+    for rule in _iter_rule_blocks(config, "security_rule"):
         access = rule.get("access", "").lower()
 
         # Skip deny rules
         if access != "allow":
             continue
 
+        direction = rule.get("direction", "").lower()
+
         # Parse ports (Azure uses destination_port_range)
         port_range = rule.get("destination_port_range", "*")
         if port_range == "*":
@@ -456,18 +619,14 @@ def _parse_azure_nsg(
         if isinstance(source_prefixes, list):
             cidr_blocks.extend(source_prefixes)
 
-        is_unrestricted = is_unrestricted_rule(
-            cidr_blocks, [], from_port, to_port, protocol
-        )
-
         if direction == "inbound":
-            exposed = check_sensitive_port_exposure(
+            is_unrestricted, exposed = evaluate_rule(
                 cidr_blocks, [], from_port, to_port, protocol
             )
             sensitive_ports_exposed.extend(exposed)
 
             ingress_rules.append(
-                IngressRule(
+                IngressRule.model_construct(
                     description=rule.get("description"),
                     from_port=from_port,
                     to_port=to_port,
@@ -477,8 +636,12 @@ def _parse_azure_nsg(
                 )
             )
         else:
+            is_unrestricted = is_unrestricted_rule(
+                cidr_blocks, [], from_port, to_port, protocol
+            )
+
             egress_rules.append(
-                EgressRule(
+                EgressRule.model_construct(
                     description=rule.get("description"),
                     from_port=from_port,
                     to_port=to_port,
@@ -522,30 +685,16 @@ def _parse_gcp_firewall(
     direction = config.get("direction", "INGRESS").upper()
 
     # Source/destination ranges
-    source_ranges = config.get("source_ranges", [])
-    if isinstance(source_ranges, str):
-        source_ranges = [source_ranges]
-
-    dest_ranges = config.get("destination_ranges", [])
-    if isinstance(dest_ranges, str):
-        dest_ranges = [dest_ranges]
+    source_ranges = _as_list(config.get("source_ranges", []))
+    dest_ranges = _as_list(config.get("destination_ranges", []))
 
     # Allow rules
-    allow_blocks = config.get("allow", [])
-    if isinstance(allow_blocks, dict):
-        allow_blocks = [allow_blocks]
-
-    for allow in allow_blocks:
-        if not isinstance(allow, dict):
-            continue
-
+    for allow in _iter_rule_blocks(config, "allow"):
         protocol = allow.get("protocol", "all")
         if protocol == "all":
             protocol = "-1"
 
-        ports = allow.get("ports", [])
-        if isinstance(ports, str):
-            ports = [ports]
+        ports = _as_list(allow.get("ports", []))
 
         # Parse port ranges
         for port_spec in ports if ports else [None]:
@@ -560,18 +709,14 @@ def _parse_gcp_firewall(
 
             cidr_blocks = source_ranges if direction == "INGRESS" else dest_ranges
 
-            is_unrestricted = is_unrestricted_rule(
-                cidr_blocks, [], from_port, to_port, protocol
-            )
-
             if direction == "INGRESS":
-                exposed = check_sensitive_port_exposure(
+                is_unrestricted, exposed = evaluate_rule(
                     cidr_blocks, [], from_port, to_port, protocol
                 )
                 sensitive_ports_exposed.extend(exposed)
 
                 ingress_rules.append(
-                    IngressRule(
+                    IngressRule.model_construct(
                         description=config.get("description"),
                         from_port=from_port,
                         to_port=to_port,
@@ -581,8 +726,12 @@ def _parse_gcp_firewall(
                     )
                 )
             else:
+                is_unrestricted = is_unrestricted_rule(
+                    cidr_blocks, [], from_port, to_port, protocol
+                )
+
                 egress_rules.append(
-                    EgressRule(
+                    EgressRule.model_construct(
                         description=config.get("description"),
                         from_port=from_port,
                         to_port=to_port,
@@ -606,6 +755,192 @@ def _parse_gcp_firewall(
     )
 
 
+def _parse_aws_security_group(
+    name: str, config: dict[str, Any], file_path: str
+) -> SecurityGroupInfo:
+    """Parse an aws_security_group resource."""
+    return _parse_security_group(name, config, file_path, "aws_security_group")
+
+
+def _parse_aws_vpc(name: str, config: dict[str, Any], file_path: str) -> VPCInfo:
+    """Parse an aws_vpc resource."""
+    return VPCInfo(
+        resource_address=f"aws_vpc.{name}",
+        cidr_block=config.get("cidr_block"),
+        source_file=file_path,
+    )
+
+
+def _parse_azure_vnet(name: str, config: dict[str, Any], file_path: str) -> VPCInfo:
+    """Parse an azurerm_virtual_network resource."""
+    address_space = config.get("address_space", [])
+    cidr = address_space[0] if address_space else None
+    return VPCInfo(
+        resource_address=f"azurerm_virtual_network.{name}",
+        cidr_block=cidr,
+        source_file=file_path,
+    )
+
+
+def _parse_gcp_network(name: str, config: dict[str, Any], file_path: str) -> VPCInfo:
+    """Parse a google_compute_network resource."""
+    return VPCInfo(
+        resource_address=f"google_compute_network.{name}",
+        cidr_block=None,  # GCP VPCs don't have a single CIDR
+        source_file=file_path,
+    )
+
+
+def _parse_aws_subnet(name: str, config: dict[str, Any], file_path: str) -> SubnetInfo:
+    """Parse an aws_subnet resource."""
+    # Check if public
+    map_public = _as_bool(config.get("map_public_ip_on_launch", False))
+
+    return SubnetInfo(
+        resource_address=f"aws_subnet.{name}",
+        vpc_ref=config.get("vpc_id"),
+        cidr_block=config.get("cidr_block"),
+        is_public=map_public,
+        availability_zone=config.get("availability_zone"),
+        source_file=file_path,
+    )
+
+
+def _parse_aws_route_table(
+    name: str, config: dict[str, Any], file_path: str
+) -> RouteTableInfo:
+    """Parse an aws_route_table resource."""
+    routes: list[RouteInfo] = []
+
+    # Parse route blocks
+    route_blocks = config.get("route", [])
+    if isinstance(route_blocks, dict):
+        route_blocks = [route_blocks]
+
+    for route in route_blocks:
+        if not isinstance(route, dict):
+            continue
+
+        destination = route.get("cidr_block", route.get("destination_cidr_block"))
+
+        # Determine target type
+        target_type = "unknown"
+        target_ref = None
+
+        if route.get("gateway_id"):
+            target_type = "internet_gateway"
+            target_ref = route["gateway_id"]
+        elif route.get("nat_gateway_id"):
+            target_type = "nat_gateway"
+            target_ref = route["nat_gateway_id"]
+        elif route.get("vpc_peering_connection_id"):
+            target_type = "vpc_peering"
+            target_ref = route["vpc_peering_connection_id"]
+        elif route.get("transit_gateway_id"):
+            target_type = "transit_gateway"
+            target_ref = route["transit_gateway_id"]
+        elif route.get("network_interface_id"):
+            target_type = "network_interface"
+            target_ref = route["network_interface_id"]
+
+        if destination:
+            routes.append(
+                RouteInfo.model_construct(
+                    destination=destination,
+                    target_type=target_type,
+                    target_ref=target_ref,
+                )
+            )
+
+    return RouteTableInfo(
+        resource_address=f"aws_route_table.{name}",
+        vpc_ref=config.get("vpc_id"),
+        routes=routes,
+        source_file=file_path,
+    )
+
+
+def _parse_aws_internet_gateway(
+    name: str, config: dict[str, Any], file_path: str
+) -> InternetGatewayInfo:
+    """Parse an aws_internet_gateway resource."""
+    return InternetGatewayInfo(
+        resource_address=f"aws_internet_gateway.{name}",
+        vpc_ref=config.get("vpc_id"),
+        source_file=file_path,
+    )
+
+
+def _parse_aws_nat_gateway(
+    name: str, config: dict[str, Any], file_path: str
+) -> NATGatewayInfo:
+    """Parse an aws_nat_gateway resource."""
+    return NATGatewayInfo(
+        resource_address=f"aws_nat_gateway.{name}",
+        subnet_ref=config.get("subnet_id"),
+        source_file=file_path,
+    )
+
+
+def _parse_aws_lb(name: str, config: dict[str, Any], file_path: str) -> LoadBalancerInfo:
+    """Parse an aws_lb (ALB/NLB) resource."""
+    is_internal = _as_bool(config.get("internal", False))
+    sgs = _as_list(config.get("security_groups", []))
+    subnets = _as_list(config.get("subnets", []))
+
+    return LoadBalancerInfo(
+        resource_address=f"aws_lb.{name}",
+        type=config.get("load_balancer_type", "application"),
+        is_internal=is_internal,
+        security_group_refs=sgs,
+        subnet_refs=subnets,
+        source_file=file_path,
+    )
+
+
+def _parse_aws_alb(name: str, config: dict[str, Any], file_path: str) -> LoadBalancerInfo:
+    """Parse an aws_alb resource (legacy name for aws_lb)."""
+    is_internal = _as_bool(config.get("internal", False))
+    sgs = _as_list(config.get("security_groups", []))
+
+    return LoadBalancerInfo(
+        resource_address=f"aws_alb.{name}",
+        type="application",
+        is_internal=is_internal,
+        security_group_refs=sgs,
+        source_file=file_path,
+    )
+
+
+# Resource type -> (NetworkInventory field, builder), in a single table so each
+# parsed file is traversed once however many resource types are supported
+_RESOURCE_HANDLERS: dict[str, tuple[str, Callable[[str, dict[str, Any], str], Any]]] = {
+    "aws_security_group": ("security_groups", _parse_aws_security_group),
+    "azurerm_network_security_group": ("security_groups", _parse_azure_nsg),
+    "google_compute_firewall": ("security_groups", _parse_gcp_firewall),
+    "aws_vpc": ("vpcs", _parse_aws_vpc),
+    "azurerm_virtual_network": ("vpcs", _parse_azure_vnet),
+    "google_compute_network": ("vpcs", _parse_gcp_network),
+    "aws_subnet": ("subnets", _parse_aws_subnet),
+    "aws_route_table": ("route_tables", _parse_aws_route_table),
+    "aws_internet_gateway": ("internet_gateways", _parse_aws_internet_gateway),
+    "aws_nat_gateway": ("nat_gateways", _parse_aws_nat_gateway),
+    "aws_lb": ("load_balancers", _parse_aws_lb),
+    "aws_alb": ("load_balancers", _parse_aws_alb),
+}
+
+# Matches any supported resource type name, so files that cannot contain a
+# network resource skip the HCL parser entirely
+_RESOURCE_SNIFF = re.compile(
+    "|".join(re.escape(resource_type) for resource_type in _RESOURCE_HANDLERS).encode()
+)
+
+# The same table split by field, for the single-field extract_* helpers
+_FIELD_HANDLERS: dict[str, dict[str, tuple[str, Callable[[str, dict[str, Any], str], Any]]]] = {}
+for _resource_type, _handler in _RESOURCE_HANDLERS.items():
+    _FIELD_HANDLERS.setdefault(_handler[0], {})[_resource_type] = _handler
+
+
 def extract_vpcs(parsed: dict[str, Any], file_path: str) -> list[VPCInfo]:
     """Extract VPCs from parsed Terraform.
 
@@ -616,55 +951,7 @@ def extract_vpcs(parsed: dict[str, Any], file_path: str) -> list[VPCInfo]:
     Returns:
         List of VPCInfo objects
     """
-    vpcs: list[VPCInfo] = []
-
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
-            continue
-
-        # AWS VPC
-        vpc_resources = resource.get("aws_vpc", {})
-        if isinstance(vpc_resources, dict):
-            for vpc_name, vpc_config in vpc_resources.items():
-                if isinstance(vpc_config, dict):
-                    vpcs.append(
-                        VPCInfo(
-                            resource_address=f"aws_vpc.{vpc_name}",
-                            cidr_block=vpc_config.get("cidr_block"),
-                            source_file=file_path,
-                        )
-                    )
-
-        # Azure Virtual Network
-        vnet_resources = resource.get("azurerm_virtual_network", {})
-        if isinstance(vnet_resources, dict):
-            for vnet_name, vnet_config in vnet_resources.items():
-                if isinstance(vnet_config, dict):
-                    address_space = vnet_config.get("address_space", [])
-                    cidr = address_space[0] if address_space else None
-                    vpcs.append(
-                        VPCInfo(
-                            resource_address=f"azurerm_virtual_network.{vnet_name}",
-                            cidr_block=cidr,
-                            source_file=file_path,
-                        )
-                    )
-
-        # GCP VPC Network
-        gcp_vpc_resources = resource.get("google_compute_network", {})
-        if isinstance(gcp_vpc_resources, dict):
-            for gcp_vpc_name, gcp_vpc_config in gcp_vpc_resources.items():
-                if isinstance(gcp_vpc_config, dict):
-                    vpcs.append(
-                        VPCInfo(
-                            resource_address=f"google_compute_network.{gcp_vpc_name}",
-                            cidr_block=None,  # GCP VPCs don't have a single CIDR
-                            source_file=file_path,
-                        )
-                    )
-
-    return vpcs
+    return _extract_field(parsed, file_path, "vpcs")
 
 
 def extract_subnets(parsed: dict[str, Any], file_path: str) -> list[SubnetInfo]:
@@ -677,35 +964,7 @@ def extract_subnets(parsed: dict[str, Any], file_path: str) -> list[SubnetInfo]:
     Returns:
         List of SubnetInfo objects
     """
-    subnets: list[SubnetInfo] = []
-
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
-            continue
-
-        # AWS Subnet
-        subnet_resources = resource.get("aws_subnet", {})
-        if isinstance(subnet_resources, dict):
-            for subnet_name, subnet_config in subnet_resources.items():
-                if isinstance(subnet_config, dict):
-                    # Check if public
-                    map_public = subnet_config.get("map_public_ip_on_launch", False)
-                    if isinstance(map_public, str):
-                        map_public = map_public.lower() == "true"
-
-                    subnets.append(
-                        SubnetInfo(
-                            resource_address=f"aws_subnet.{subnet_name}",
-                            vpc_ref=subnet_config.get("vpc_id"),
-                            cidr_block=subnet_config.get("cidr_block"),
-                            is_public=map_public,
-                            availability_zone=subnet_config.get("availability_zone"),
-                            source_file=file_path,
-                        )
-                    )
-
-    return subnets
+    return _extract_field(parsed, file_path, "subnets")
 
 
 def extract_route_tables(
@@ -720,72 +979,7 @@ def extract_route_tables(
     Returns:
         List of RouteTableInfo objects
     """
-    route_tables: list[RouteTableInfo] = []
-
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
-            continue
-
-        # AWS Route Table
-        rt_resources = resource.get("aws_route_table", {})
-        if isinstance(rt_resources, dict):
-            for rt_name, rt_config in rt_resources.items():
-                if not isinstance(rt_config, dict):
-                    continue
-
-                routes: list[RouteInfo] = []
-
-                # Parse route blocks
-                route_blocks = rt_config.get("route", [])
-                if isinstance(route_blocks, dict):
-                    route_blocks = [route_blocks]
-
-                for route in route_blocks:
-                    if not isinstance(route, dict):
-                        continue
-
-                    destination = route.get("cidr_block", route.get("destination_cidr_block"))
-
-                    # Determine target type
-                    target_type = "unknown"
-                    target_ref = None
-
-                    if route.get("gateway_id"):
-                        target_type = "internet_gateway"
-                        target_ref = route["gateway_id"]
-                    elif route.get("nat_gateway_id"):
-                        target_type = "nat_gateway"
-                        target_ref = route["nat_gateway_id"]
-                    elif route.get("vpc_peering_connection_id"):
-                        target_type = "vpc_peering"
-                        target_ref = route["vpc_peering_connection_id"]
-                    elif route.get("transit_gateway_id"):
-                        target_type = "transit_gateway"
-                        target_ref = route["transit_gateway_id"]
-                    elif route.get("network_interface_id"):
-                        target_type = "network_interface"
-                        target_ref = route["network_interface_id"]
-
-                    if destination:
-                        routes.append(
-                            RouteInfo(
-                                destination=destination,
-                                target_type=target_type,
-                                target_ref=target_ref,
-                            )
-                        )
-
-                route_tables.append(
-                    RouteTableInfo(
-                        resource_address=f"aws_route_table.{rt_name}",
-                        vpc_ref=rt_config.get("vpc_id"),
-                        routes=routes,
-                        source_file=file_path,
-                    )
-                )
-
-    return route_tables
+    return _extract_field(parsed, file_path, "route_tables")
 
 
 def extract_internet_gateways(
@@ -800,26 +994,7 @@ def extract_internet_gateways(
     Returns:
         List of InternetGatewayInfo objects
     """
-    gateways: list[InternetGatewayInfo] = []
-
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
-            continue
-
-        igw_resources = resource.get("aws_internet_gateway", {})
-        if isinstance(igw_resources, dict):
-            for igw_name, igw_config in igw_resources.items():
-                if isinstance(igw_config, dict):
-                    gateways.append(
-                        InternetGatewayInfo(
-                            resource_address=f"aws_internet_gateway.{igw_name}",
-                            vpc_ref=igw_config.get("vpc_id"),
-                            source_file=file_path,
-                        )
-                    )
-
-    return gateways
+    return _extract_field(parsed, file_path, "internet_gateways")
 
 
 def extract_nat_gateways(
@@ -834,26 +1009,7 @@ def extract_nat_gateways(
     Returns:
         List of NATGatewayInfo objects
     """
-    gateways: list[NATGatewayInfo] = []
-
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
-            continue
-
-        nat_resources = resource.get("aws_nat_gateway", {})
-        if isinstance(nat_resources, dict):
-            for nat_name, nat_config in nat_resources.items():
-                if isinstance(nat_config, dict):
-                    gateways.append(
-                        NATGatewayInfo(
-                            resource_address=f"aws_nat_gateway.{nat_name}",
-                            subnet_ref=nat_config.get("subnet_id"),
-                            source_file=file_path,
-                        )
-                    )
-
-    return gateways
+    return _extract_field(parsed, file_path, "nat_gateways")
 
 
 def extract_load_balancers(
@@ -868,81 +1024,144 @@ def extract_load_balancers(
     Returns:
         List of LoadBalancerInfo objects
     """
-    load_balancers: list[LoadBalancerInfo] = []
+    return _extract_field(parsed, file_path, "load_balancers")
 
-    resource_blocks = parsed.get("resource", [])
-    for resource in resource_blocks:
-        if not isinstance(resource, dict):
+
+def _collect_tf_files(
+    root_path: str | Path,
+    tf_paths: list[str] | None,
+) -> list[tuple[str, str]]:
+    """Collect .tf files under the scan paths, skipping excluded directories.
+
+    Args:
+        root_path: Root directory of the repository
+        tf_paths: Optional list of specific paths to scan
+
+    Returns:
+        List of (absolute path, path relative to root) tuples in walk order
+    """
+    root = Path(root_path).resolve()
+
+    # Determine paths to scan
+    if tf_paths:
+        scan_paths = [root / p for p in tf_paths]
+    else:
+        scan_paths = [root]
+
+    tf_files: list[tuple[str, str]] = []
+
+    # Bind hot lookups to locals once, outside the per-entry loop
+    add_file = tf_files.append
+    excluded = _EXCLUDED
+
+    for scan_path in scan_paths:
+        if not scan_path.exists():
             continue
 
-        # AWS ALB/NLB
-        lb_resources = resource.get("aws_lb", {})
-        if isinstance(lb_resources, dict):
-            for lb_name, lb_config in lb_resources.items():
-                if isinstance(lb_config, dict):
-                    is_internal = lb_config.get("internal", False)
-                    if isinstance(is_internal, str):
-                        is_internal = is_internal.lower() == "true"
-
-                    sgs = lb_config.get("security_groups", [])
-                    if isinstance(sgs, str):
-                        sgs = [sgs]
-
-                    subnets = lb_config.get("subnets", [])
-                    if isinstance(subnets, str):
-                        subnets = [subnets]
-
-                    load_balancers.append(
-                        LoadBalancerInfo(
-                            resource_address=f"aws_lb.{lb_name}",
-                            type=lb_config.get("load_balancer_type", "application"),
-                            is_internal=is_internal,
-                            security_group_refs=sgs,
-                            subnet_refs=subnets,
-                            source_file=file_path,
-                        )
-                    )
+        # Iterative os.scandir walk; DirEntry caches the entry type, so
+        # directories and files are told apart without extra stat calls
+        stack: list[tuple[str, str]] = [
+            (str(scan_path), os.path.relpath(scan_path, root))
+        ]
+
+        while stack:
+            abs_dir, rel_dir = stack.pop()
+            # Relative prefix for children of this directory ("" at the root)
+            prefix = "" if rel_dir == "." else rel_dir + os.sep
+            subdirs: list[tuple[str, str]] = []
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        name = entry.name
+
+                        if entry.is_dir(follow_symlinks=False):
+                            # Filter excluded directories
+                            if name[:1] != "." and name not in excluded:
+                                subdirs.append((entry.path, prefix + name))
+                            continue
+
+                        if name.endswith(".tf"):
+                            add_file((entry.path, prefix + name))
+            except OSError:
+                # Unreadable directory - skip it, as os.walk would
+                continue
+
+            # Reversed so subdirectories are visited in os.walk's top-down order
+            stack.extend(reversed(subdirs))
+
+    return tf_files
+
+
+def _parse_and_extract(
+    file_path: str | os.PathLike[str], rel_path: str
+) -> dict[str, list[Any]] | None:
+    """Parse one file and extract its network resources.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        file_path: Path to .tf file
+        rel_path: Path relative to the repository root, recorded as source_file
+
+    Returns:
+        Output of extract_network_resources, or None if parsing failed
+    """
+    parsed = parse_tf_file(file_path)
+    if parsed is None:
+        return None
+    return extract_network_resources(parsed, rel_path)
 
-        # AWS ALB (legacy name)
-        alb_resources = resource.get("aws_alb", {})
-        if isinstance(alb_resources, dict):
-            for alb_name, alb_config in alb_resources.items():
-                if isinstance(alb_config, dict):
-                    is_internal = alb_config.get("internal", False)
-                    if isinstance(is_internal, str):
-                        is_internal = is_internal.lower() == "true"
-
-                    sgs = alb_config.get("security_groups", [])
-                    if isinstance(sgs, str):
-                        sgs = [sgs]
-
-                    load_balancers.append(
-                        LoadBalancerInfo(
-                            resource_address=f"aws_alb.{alb_name}",
-                            type="application",
-                            is_internal=is_internal,
-                            security_group_refs=sgs,
-                            source_file=file_path,
-                        )
-                    )
 
-    return load_balancers
+def _extract_tree(
+    root_path: str | Path,
+    tf_paths: list[str] | None,
+) -> list[tuple[str, dict[str, list[Any]] | None]]:
+    """Parse and extract network resources from every .tf file under the scan paths.
+
+    Args:
+        root_path: Root directory of the repository
+        tf_paths: Optional list of specific paths to scan
+
+    Returns:
+        List of (path relative to root, extracted resources or None) tuples
+    """
+    tf_files = _collect_tf_files(root_path, tf_paths)
+    abs_paths = [abs_path for abs_path, _ in tf_files]
+    rel_paths = [rel_path for _, rel_path in tf_files]
+
+    # Parsing and extraction are CPU-bound pure Python, so large trees are
+    # processed across processes, which send back only the network records;
+    # small ones stay in-process to avoid pool start-up cost.
+    if len(tf_files) < PARALLEL_PARSE_MIN_FILES:
+        extracted = list(map(_parse_and_extract, abs_paths, rel_paths))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            extracted = list(
+                executor.map(_parse_and_extract, abs_paths, rel_paths, chunksize=8)
+            )
+
+    return list(zip(rel_paths, extracted, strict=True))
 
 
 def extract_network_inventory(
     root_path: str | Path = ".",
     tf_paths: list[str] | None = None,
+    parsed_files: Iterable[tuple[str, dict[str, Any] | None]] | None = None,
+    extracted_at: str | None = None,
 ) -> NetworkInventory:
     """Extract complete network inventory from Terraform configuration.
 
     Args:
         root_path: Root directory of the repository
         tf_paths: Optional list of specific paths to scan
+        parsed_files: Optional (relative path, parsed HCL) pairs already produced
+            for this run, e.g. by the MLA-05 inventory; skips walking and parsing
+        extracted_at: Optional ISO 8601 timestamp to record, e.g. the run's start
+            time; defaults to now
 
     Returns:
         NetworkInventory with all extracted network resources
     """
-    root = Path(root_path).resolve()
 
     all_security_groups: list[SecurityGroupInfo] = []
     all_vpcs: list[VPCInfo] = []
@@ -953,50 +1172,33 @@ def extract_network_inventory(
     all_load_balancers: list[LoadBalancerInfo] = []
     source_files: list[str] = []
 
-    # Determine paths to scan
-    if tf_paths:
-        scan_paths = [root / p for p in tf_paths]
+    if parsed_files is None:
+        extracted_files = _extract_tree(root_path, tf_paths)
     else:
-        scan_paths = [root]
+        # Extract all network resources in a single pass over each file
+        extracted_files = (
+            (rel_path, None if parsed is None else extract_network_resources(parsed, rel_path))
+            for rel_path, parsed in parsed_files
+        )
 
-    for scan_path in scan_paths:
-        if not scan_path.exists():
-            continue
+    for rel_path, extracted in extracted_files:
+        source_files.append(rel_path)
 
-        for dirpath, dirnames, filenames in os.walk(scan_path):
-            # Filter excluded directories
-            dirnames[:] = [
-                d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith(".")
-            ]
-
-            current_dir = Path(dirpath)
-
-            for filename in filenames:
-                if not filename.endswith(".tf"):
-                    continue
-
-                file_path = current_dir / filename
-                rel_path = str(file_path.relative_to(root))
-                source_files.append(rel_path)
-
-                # Parse file
-                parsed = parse_tf_file(file_path)
-                if parsed is None:
-                    continue
-
-                # Extract all network resources
-                all_security_groups.extend(extract_security_groups(parsed, rel_path))
-                all_vpcs.extend(extract_vpcs(parsed, rel_path))
-                all_subnets.extend(extract_subnets(parsed, rel_path))
-                all_route_tables.extend(extract_route_tables(parsed, rel_path))
-                all_internet_gateways.extend(
-                    extract_internet_gateways(parsed, rel_path)
-                )
-                all_nat_gateways.extend(extract_nat_gateways(parsed, rel_path))
-                all_load_balancers.extend(extract_load_balancers(parsed, rel_path))
+        if extracted is None:
+            continue
 
-    return NetworkInventory(
-        extracted_at=datetime.now(timezone.utc).isoformat(),
+        all_security_groups.extend(extracted["security_groups"])
+        all_vpcs.extend(extracted["vpcs"])
+        all_subnets.extend(extracted["subnets"])
+        all_route_tables.extend(extracted["route_tables"])
+        all_internet_gateways.extend(extracted["internet_gateways"])
+        all_nat_gateways.extend(extracted["nat_gateways"])
+        all_load_balancers.extend(extracted["load_balancers"])
+
+    # Every entry was validated when its resource was parsed, so skip
+    # re-validating the whole inventory on assembly
+    return NetworkInventory.model_construct(
+        extracted_at=extracted_at or datetime.now(timezone.utc).isoformat(),
         source_files=sorted(source_files),
         security_groups=all_security_groups,
         vpcs=all_vpcs,
@@ -1010,9 +1212,8 @@ def extract_network_inventory(
 
 if __name__ == "__main__":
     # Quick test
-    import json
     import sys
 
     path = sys.argv[1] if len(sys.argv) > 1 else "."
     result = extract_network_inventory(path)
-    print(json.dumps(result.model_dump(), indent=2))
+    print(result.model_dump_json(indent=2))
@@ -5,11 +5,15 @@ This is the entry point that coordinates detection, evaluation,
 inventory generation, and evidence pack creation for all KSIs.
 """
 
-import json
+import io
 import os
 import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -17,9 +21,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from shared.schemas import KSIStatus
 
 from action.src.detect import get_tf_root_paths, scan_for_terraform
-from action.src.evaluate import evaluate_terraform
-from action.src.evidence import build_evidence_pack
-from action.src.inventory import generate_inventory
+from action.src.evaluate import evaluate_terraform, get_terraform_version
+from action.src.evidence import build_evidence_pack_with_manifest
+from action.src.inventory import generate_inventory, parse_tf_files
+from action.src.serialization import dump_json_bytes
 
 # CNA-01 imports
 from action.src.ksi.cna.cna01.evaluator import evaluate_cna01
@@ -51,26 +56,41 @@ def get_github_context() -> dict[str, str]:
     }
 
 
+# Outputs queued by set_output, written together by flush_outputs
+_PENDING_OUTPUTS: list[tuple[str, str]] = []
+
+
 def set_output(name: str, value: str) -> None:
-    """Set a GitHub Actions output.
+    """Queue a GitHub Actions output to be written by flush_outputs.
 
     Args:
         name: Output name
         value: Output value
     """
+    _PENDING_OUTPUTS.append((name, value))
+
+
+def flush_outputs() -> None:
+    """Write all queued GitHub Actions outputs with a single open."""
     output_file = os.environ.get("GITHUB_OUTPUT")
     if output_file:
-        with open(output_file, "a", encoding="utf-8") as f:
+        parts: list[str] = []
+        for name, value in _PENDING_OUTPUTS:
             # Handle multiline values
             if "\n" in value:
                 import uuid
                 delimiter = uuid.uuid4().hex
-                f.write(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
+                parts.append(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
             else:
-                f.write(f"{name}={value}\n")
+                parts.append(f"{name}={value}\n")
+        with open(output_file, "a", encoding="utf-8") as f:
+            f.write("".join(parts))
     else:
         # Fallback for local testing
-        print(f"::set-output name={name}::{value}")
+        for name, value in _PENDING_OUTPUTS:
+            print(f"::set-output name={name}::{value}")
+
+    _PENDING_OUTPUTS.clear()
 
 
 def log_group(title: str) -> None:
@@ -93,12 +113,52 @@ def log_warning(message: str) -> None:
     print(f"::warning::{message}")
 
 
+class _ThreadRoutedStdout:
+    """Stdout wrapper that sends a thread's output to its own buffer, if set.
+
+    Lets a KSI run in a background thread without interleaving its log
+    groups with the foreground KSI's; the buffer is replayed afterwards.
+    """
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def run_buffered(self, fn: Callable[..., Any], *args: Any) -> tuple[Any, str]:
+        """Call fn with this thread's output captured.
+
+        Returns:
+            Tuple of (fn's return value, captured output)
+        """
+        buffer = self._local.buffer = io.StringIO()
+        try:
+            return fn(*args), buffer.getvalue()
+        except BaseException:
+            # Don't lose the log leading up to a failure
+            self._stream.write(buffer.getvalue())
+            raise
+        finally:
+            self._local.buffer = None
+
+
 def run_mla05(
     workspace: Path,
     output_dir: Path,
     ctx: dict[str, str],
     detection,
     terraform_version: str | None,
+    parsed_files: list[tuple[str, dict[str, Any] | None]] | None = None,
 ) -> dict:
     """Run KSI-MLA-05 evaluation.
 
@@ -108,6 +168,7 @@ def run_mla05(
         ctx: GitHub context
         detection: Terraform detection result
         terraform_version: Terraform version
+        parsed_files: Parsed .tf files shared with other KSIs, if available
 
     Returns:
         Dict with KSI result info
@@ -137,7 +198,7 @@ def run_mla05(
 
         # Step 3: Generate Inventory
         log_group("MLA-05: Generate Terraform Inventory")
-        inventory = generate_inventory(workspace, detection.tf_paths)
+        inventory = generate_inventory(workspace, detection.tf_paths, parsed_files)
         print(f"Resources: {inventory.resources.total_count} total")
         print(f"  By type: {list(inventory.resources.by_type.keys())}")
         print(f"Providers: {[p.name for p in inventory.providers]}")
@@ -147,7 +208,7 @@ def run_mla05(
 
     # Build Evidence Pack
     log_group("MLA-05: Generate Evidence Pack")
-    zip_path, artifact_name, status = build_evidence_pack(
+    zip_path, artifact_name, status, manifest = build_evidence_pack_with_manifest(
         output_dir=output_dir,
         detection=detection,
         inventory=inventory,
@@ -172,6 +233,7 @@ def run_mla05(
         "evidence_path": "evidence/ksi-mla-05/evaluation_manifest.json",
         "artifact_name": artifact_name,
         "zip_path": str(zip_path),
+        "criteria": manifest.criteria,
     }
 
 
@@ -181,6 +243,8 @@ def run_cna01(
     ctx: dict[str, str],
     detection,
     terraform_version: str | None,
+    parsed_files: list[tuple[str, dict[str, Any] | None]] | None = None,
+    run_timestamp: str | None = None,
 ) -> dict:
     """Run KSI-CNA-01 evaluation.
 
@@ -190,13 +254,17 @@ def run_cna01(
         ctx: GitHub context
         detection: Terraform detection result
         terraform_version: Terraform version
+        parsed_files: Parsed .tf files shared with other KSIs, if available
+        run_timestamp: ISO 8601 start time of the run, recorded in the inventory
 
     Returns:
         Dict with KSI result info
     """
     # Extract network inventory
     log_group("CNA-01: Extract Network Inventory")
-    network_inventory = extract_network_inventory(workspace, detection.tf_paths)
+    network_inventory = extract_network_inventory(
+        workspace, detection.tf_paths, parsed_files, run_timestamp
+    )
     print(f"Security groups found: {len(network_inventory.security_groups)}")
     print(f"VPCs found: {len(network_inventory.vpcs)}")
     print(f"Subnets found: {len(network_inventory.subnets)}")
@@ -249,6 +317,7 @@ def run_cna01(
         "evidence_path": "evidence/ksi-cna-01/evaluation_manifest.json",
         "artifact_name": artifact_name,
         "zip_path": str(zip_path),
+        "criteria": criteria,
     }
 
 
@@ -256,6 +325,7 @@ def write_multi_ksi_results(
     output_dir: Path,
     ksi_results: list[dict],
     ctx: dict[str, str],
+    evaluated_at: str | None = None,
 ) -> None:
     """Write the multi-KSI results.json file.
 
@@ -263,10 +333,11 @@ def write_multi_ksi_results(
         output_dir: Output directory
         ksi_results: List of KSI result dicts
         ctx: GitHub context
+        evaluated_at: Optional ISO 8601 timestamp to record; defaults to now
     """
     results = {
         "schema_version": "1.0",
-        "evaluated_at": datetime.now(timezone.utc).isoformat(),
+        "evaluated_at": evaluated_at or datetime.now(timezone.utc).isoformat(),
         "trigger_event": ctx["trigger_event"],
         "repository": ctx["repository"],
         "commit_sha": ctx["commit_sha"],
@@ -282,8 +353,7 @@ def write_multi_ksi_results(
     }
 
     results_path = output_dir / "results.json"
-    with open(results_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    results_path.write_bytes(dump_json_bytes(results))
 
 
 def main() -> int:
@@ -298,6 +368,8 @@ def main() -> int:
 
     # Get GitHub context
     ctx = get_github_context()
+    # One timestamp for the whole run, shared by the artifacts that record it
+    run_timestamp = datetime.now(timezone.utc).isoformat()
     workspace = Path(ctx["workspace"])
     output_dir = workspace / ".fedramp-evidence"
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -311,8 +383,12 @@ def main() -> int:
     print()
 
     # Step 1: Detect Terraform
+    # The version probe spawns a subprocess, so overlap it with the workspace scan
     log_group("Step 1: Terraform Detection")
-    detection = scan_for_terraform(workspace)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        version_future = executor.submit(get_terraform_version)
+        detection = scan_for_terraform(workspace)
+        probed_version = version_future.result()
     print(f"Terraform detected: {detection.detected}")
     print(f"Files found: {detection.tf_file_count}")
     print(f"Paths: {detection.tf_paths}")
@@ -321,35 +397,65 @@ def main() -> int:
 
     # Track terraform version
     terraform_version = None
+    parsed_files: list[tuple[str, dict[str, Any] | None]] = []
 
     if not detection.detected:
         log_warning("No Terraform configuration detected in repository")
     else:
-        # Quick terraform version check
-        from action.src.evaluate import get_terraform_version
-        terraform_version = get_terraform_version()
+        terraform_version = probed_version
+
+        # Parse every .tf file once; both KSIs extract from the same parse
+        log_group("Parse Terraform Configuration")
+        parsed_files = parse_tf_files(workspace, detection.tf_paths)
+        print(f"Files parsed: {len(parsed_files)}")
+        log_group_end()
 
     # Collect results from all KSIs
     ksi_results: list[dict] = []
 
-    # Run MLA-05
-    print()
-    print("-" * 60)
-    print("KSI-MLA-05: Evaluate Configuration")
-    print("-" * 60)
-    mla05_result = run_mla05(workspace, output_dir, ctx, detection, terraform_version)
-    ksi_results.append(mla05_result)
+    # MLA-05 spends most of its time waiting on terraform subprocesses, so
+    # CNA-01 runs alongside it in a thread; its log is buffered and replayed
+    # after MLA-05's so the log groups stay in order.
+    stdout = _ThreadRoutedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cna01_future = executor.submit(
+                stdout.run_buffered,
+                run_cna01,
+                workspace,
+                output_dir,
+                ctx,
+                detection,
+                terraform_version,
+                parsed_files,
+                run_timestamp,
+            )
+
+            # Run MLA-05
+            print()
+            print("-" * 60)
+            print("KSI-MLA-05: Evaluate Configuration")
+            print("-" * 60)
+            mla05_result = run_mla05(
+                workspace, output_dir, ctx, detection, terraform_version, parsed_files
+            )
+            ksi_results.append(mla05_result)
+
+            cna01_result, cna01_log = cna01_future.result()
+    finally:
+        sys.stdout = stdout._stream
 
     # Run CNA-01
     print()
     print("-" * 60)
     print("KSI-CNA-01: Restrict Network Traffic")
     print("-" * 60)
-    cna01_result = run_cna01(workspace, output_dir, ctx, detection, terraform_version)
+    sys.stdout.write(cna01_log)
     ksi_results.append(cna01_result)
 
     # Write combined results.json
-    write_multi_ksi_results(output_dir, ksi_results, ctx)
+    write_multi_ksi_results(output_dir, ksi_results, ctx, run_timestamp)
 
     # Set outputs (use MLA-05 artifact for backward compatibility)
     set_output("status", mla05_result["status"])
@@ -400,46 +506,39 @@ def main() -> int:
     ])
 
     # MLA-05 criteria details
-    mla05_manifest_path = output_dir / "evidence" / "ksi-mla-05" / "evaluation_manifest.json"
-    if mla05_manifest_path.exists():
-        with open(mla05_manifest_path, "r") as f:
-            manifest = json.load(f)
-        summary_lines.append("### KSI-MLA-05 Criteria Details")
-        summary_lines.append("")
-        for criterion in manifest.get("criteria", []):
-            status_emoji = {
-                "PASS": "✅",
-                "FAIL": "❌",
-                "ERROR": "⚠️",
-                "SKIP": "⏭️",
-            }.get(criterion["status"], "❓")
-            summary_lines.append(
-                f"- {status_emoji} **{criterion['id']}** ({criterion['name']}): {criterion['status']}"
-            )
-            summary_lines.append(f"  - {criterion['reason']}")
-        summary_lines.append("")
+    summary_lines.append("### KSI-MLA-05 Criteria Details")
+    summary_lines.append("")
+    for criterion in mla05_result["criteria"]:
+        status_emoji = {
+            "PASS": "✅",
+            "FAIL": "❌",
+            "ERROR": "⚠️",
+            "SKIP": "⏭️",
+        }.get(criterion.status.value, "❓")
+        summary_lines.append(
+            f"- {status_emoji} **{criterion.id}** ({criterion.name}): {criterion.status.value}"
+        )
+        summary_lines.append(f"  - {criterion.reason}")
+    summary_lines.append("")
 
     # CNA-01 criteria details
-    cna01_manifest_path = output_dir / "evidence" / "ksi-cna-01" / "evaluation_manifest.json"
-    if cna01_manifest_path.exists():
-        with open(cna01_manifest_path, "r") as f:
-            manifest = json.load(f)
-        summary_lines.append("### KSI-CNA-01 Criteria Details")
-        summary_lines.append("")
-        for criterion_id, criterion in manifest.get("criteria", {}).items():
-            status_emoji = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}.get(
-                criterion["status"], "❓"
-            )
-            summary_lines.append(
-                f"- {status_emoji} **{criterion['id']}** ({criterion['name']}): {criterion['status']}"
-            )
-            if criterion.get("findings"):
-                finding_count = len(criterion["findings"])
-                summary_lines.append(f"  - {finding_count} finding(s)")
-        summary_lines.append("")
+    summary_lines.append("### KSI-CNA-01 Criteria Details")
+    summary_lines.append("")
+    for criterion in cna01_result["criteria"].values():
+        status_emoji = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}.get(
+            criterion.status, "❓"
+        )
+        summary_lines.append(
+            f"- {status_emoji} **{criterion.id}** ({criterion.name}): {criterion.status}"
+        )
+        if criterion.findings:
+            finding_count = len(criterion.findings)
+            summary_lines.append(f"  - {finding_count} finding(s)")
+    summary_lines.append("")
 
     summary = "\n".join(summary_lines)
     set_output("summary", summary)
+    flush_outputs()
 
     # Write to GitHub Step Summary
     summary_file = os.environ.get("GITHUB_STEP_SUMMARY")
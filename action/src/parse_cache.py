@@ -0,0 +1,134 @@
+"""On-disk cache for parsed Terraform files.
+
+Parsing HCL is the most expensive step of inventory generation, and most .tf
+files are unchanged between runs. When enabled, parsed files are stored as
+JSON keyed by absolute path and validated against the file's mtime and size.
+When only the mtime differs, as after a fresh CI checkout, a digest of the
+file's content decides whether the entry is still valid.
+
+The cache is opt-in: set FEDRAMPGPT_HCL_CACHE=1 to enable it. The cache
+directory defaults to .fedrampgpt-cache/hcl and can be overridden with
+FEDRAMPGPT_HCL_CACHE_DIR.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+CACHE_ENV_VAR = "FEDRAMPGPT_HCL_CACHE"
+CACHE_DIR_ENV_VAR = "FEDRAMPGPT_HCL_CACHE_DIR"
+DEFAULT_CACHE_DIR = ".fedrampgpt-cache/hcl"
+
+# Bump when the parser or the shape of cached results changes, so existing
+# entries are ignored rather than served stale
+CACHE_SCHEMA_VERSION = 1
+
+
+def cache_enabled() -> bool:
+    """Check whether the on-disk parse cache is enabled."""
+    return os.environ.get(CACHE_ENV_VAR, "") == "1"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory holding cached parse results."""
+    return Path(os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR))
+
+
+def _entry_path(abs_path: str) -> Path:
+    """Get the cache entry path for an absolute source path.
+
+    The key only names the entry file; freshness is checked against mtime and
+    size. A short BLAKE2b digest is enough here; SHA-256 is reserved for the
+    published hashes.sha256 evidence manifests.
+    """
+    key = hashlib.blake2b(abs_path.encode("utf-8"), digest_size=16).hexdigest()
+    return get_cache_dir() / f"{key}.json"
+
+
+def _content_digest(abs_path: str) -> str | None:
+    """Get a BLAKE2b digest of a file's content, or None if it can't be read."""
+    try:
+        with open(abs_path, "rb") as f:
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+    except OSError:
+        return None
+
+
+def cached_parse(
+    file_path: str | os.PathLike[str],
+    parse: Callable[[str | os.PathLike[str]], dict[str, Any] | None],
+) -> dict[str, Any] | None:
+    """Parse a file, reusing a cached result when the file is unchanged.
+
+    Args:
+        file_path: Path to the .tf file
+        parse: Parser to call on a cache miss
+
+    Returns:
+        Parsed HCL dict or None if parsing failed
+    """
+    if not cache_enabled():
+        return parse(file_path)
+
+    try:
+        abs_path = os.path.abspath(file_path)
+        st = os.stat(abs_path)
+    except OSError:
+        return parse(file_path)
+
+    entry_path = _entry_path(abs_path)
+    digest: str | None = None
+
+    try:
+        with open(entry_path, "rb") as f:
+            entry = json.load(f)
+        if entry["version"] == CACHE_SCHEMA_VERSION and entry["size"] == st.st_size:
+            if entry["mtime_ns"] == st.st_mtime_ns:
+                return entry["parsed"]
+
+            # Same size but a new mtime: reuse the entry if the content is
+            # unchanged, and record the new mtime for the next lookup
+            digest = _content_digest(abs_path)
+            if digest is not None and digest == entry["digest"]:
+                entry["mtime_ns"] = st.st_mtime_ns
+                _store(entry_path, entry)
+                return entry["parsed"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    parsed = parse(file_path)
+    if parsed is not None:
+        if digest is None:
+            digest = _content_digest(abs_path)
+        _store(
+            entry_path,
+            {
+                "version": CACHE_SCHEMA_VERSION,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "digest": digest,
+                "parsed": parsed,
+            },
+        )
+    return parsed
+
+
+def _store(entry_path: Path, entry: dict[str, Any]) -> None:
+    """Atomically write a cache entry, ignoring failures."""
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # The cache is best-effort; parsing already succeeded
+        pass
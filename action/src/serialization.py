@@ -0,0 +1,44 @@
+"""Serialization helpers shared by the evidence pack builders."""
+
+import json
+import zipfile
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Payloads up to this size are stored uncompressed in evidence zips; deflating
+# them saves only a few hundred bytes at most
+ZIP_STORED_MAX_BYTES = 1024
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes.
+
+    Uses orjson when installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def zip_compress_type(payload: bytes) -> int:
+    """Choose the zip compression method for an evidence payload.
+
+    Args:
+        payload: Bytes to be archived
+
+    Returns:
+        zipfile.ZIP_STORED for small payloads, otherwise zipfile.ZIP_DEFLATED
+    """
+    if len(payload) <= ZIP_STORED_MAX_BYTES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
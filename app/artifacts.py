@@ -1,15 +1,41 @@
 """GitHub artifact download and processing."""
 
+import asyncio
 import fnmatch
 import io
 import json
+import re
+import tempfile
 import zipfile
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import IO, Any
 
-import httpx
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.gh_cache import cached_get_json
 from app.github_auth import github_auth
+from app.http_client import get_client
+
+# Cap on concurrent artifact downloads, to stay clear of GitHub's secondary
+# rate limits
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Name pattern shared by the evidence artifacts of every KSI
+# (evidence_ksi-xxx-xx_*), compiled once rather than per artifact
+KSI_EVIDENCE_ARTIFACT_PATTERN = "evidence_ksi-*_*"
+_KSI_EVIDENCE_RE = re.compile(fnmatch.translate(KSI_EVIDENCE_ARTIFACT_PATTERN))
+
+# KSI part of an evidence artifact name: evidence_<ksi-xxx-yy>_sha_timestamp
+_KSI_ID_RE = re.compile(r"evidence_(ksi-[^_]*)")
+
+# Downloads are spooled in memory up to this size, then to a temporary file
+ARTIFACT_SPOOL_MAX_BYTES = 16 << 20
+DOWNLOAD_CHUNK_BYTES = 1 << 20
 
 
 async def list_workflow_run_artifacts(
@@ -32,17 +58,51 @@ async def list_workflow_run_artifacts(
     token = await github_auth.get_installation_token(installation_id)
     settings = get_settings()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{settings.github_api_url}/repos/{owner}/{repo}/actions/runs/{run_id}/artifacts",
-            headers=github_auth.get_headers(token),
-        )
-        response.raise_for_status()
-        data = response.json()
+    # A completed run's artifacts don't change, so a short-lived cached listing
+    # is safe to reuse
+    data = await cached_get_json(
+        ("artifacts", installation_id, owner, repo, run_id),
+        f"{settings.github_api_url}/repos/{owner}/{repo}/actions/runs/{run_id}/artifacts",
+        github_auth.get_headers(token),
+    )
 
     return data.get("artifacts", [])
 
 
+def classify_artifacts(
+    artifacts: list[dict[str, Any]],
+    settings: Settings | None = None,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, list[dict[str, Any]]]:
+    """Sort a workflow run's artifacts into the kinds the app reads, in one pass.
+
+    Args:
+        artifacts: Artifact metadata dicts from list_workflow_run_artifacts
+        settings: Settings holding the artifact names (default: get_settings())
+
+    Returns:
+        Tuple of (first artifact matching the configured evidence pattern,
+        results summary artifact, all KSI evidence artifacts in listing order)
+    """
+    if settings is None:
+        settings = get_settings()
+
+    evidence_re = settings.evidence_artifact_regex
+    evidence_artifact = None
+    results_artifact = None
+    evidence_artifacts: list[dict[str, Any]] = []
+
+    for artifact in artifacts:
+        name = artifact.get("name", "")
+        if evidence_artifact is None and evidence_re.match(name):
+            evidence_artifact = artifact
+        if results_artifact is None and name == settings.results_artifact_name:
+            results_artifact = artifact
+        if _KSI_EVIDENCE_RE.match(name):
+            evidence_artifacts.append(artifact)
+
+    return evidence_artifact, results_artifact, evidence_artifacts
+
+
 async def find_evidence_artifact(
     installation_id: int,
     owner: str,
@@ -60,16 +120,9 @@ async def find_evidence_artifact(
     Returns:
         Artifact metadata dict or None if not found
     """
-    settings = get_settings()
     artifacts = await list_workflow_run_artifacts(installation_id, owner, repo, run_id)
-
-    # Look for evidence artifact matching pattern
-    for artifact in artifacts:
-        name = artifact.get("name", "")
-        if fnmatch.fnmatch(name, settings.artifact_name_pattern):
-            return artifact
-
-    return None
+    evidence_artifact, _, _ = classify_artifacts(artifacts)
+    return evidence_artifact
 
 
 async def find_all_evidence_artifacts(
@@ -90,14 +143,7 @@ async def find_all_evidence_artifacts(
         List of artifact metadata dicts matching KSI evidence patterns
     """
     artifacts = await list_workflow_run_artifacts(installation_id, owner, repo, run_id)
-
-    # Match evidence artifacts for any KSI (evidence_ksi-xxx-xx_*)
-    evidence_artifacts = []
-    for artifact in artifacts:
-        name = artifact.get("name", "")
-        if fnmatch.fnmatch(name, "evidence_ksi-*_*"):
-            evidence_artifacts.append(artifact)
-
+    _, _, evidence_artifacts = classify_artifacts(artifacts)
     return evidence_artifacts
 
 
@@ -118,84 +164,111 @@ async def find_results_artifact(
     Returns:
         Artifact metadata dict or None if not found
     """
-    settings = get_settings()
     artifacts = await list_workflow_run_artifacts(installation_id, owner, repo, run_id)
-
-    for artifact in artifacts:
-        if artifact.get("name") == settings.results_artifact_name:
-            return artifact
-
-    return None
+    _, results_artifact, _ = classify_artifacts(artifacts)
+    return results_artifact
 
 
+@asynccontextmanager
 async def download_artifact(
     installation_id: int,
     owner: str,
     repo: str,
     artifact_id: int,
-) -> bytes:
+) -> AsyncIterator[IO[bytes]]:
     """Download an artifact zip file.
 
+    The body is streamed into a spooled temporary file, so large artifacts
+    spill to disk instead of being held in memory whole. The file is closed
+    when the context exits.
+
     Args:
         installation_id: GitHub App installation ID
         owner: Repository owner
         repo: Repository name
         artifact_id: Artifact ID
 
-    Returns:
-        Artifact content as bytes
+    Yields:
+        Binary file positioned at the start of the artifact
     """
     token = await github_auth.get_installation_token(installation_id)
     settings = get_settings()
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.get(
+    with tempfile.SpooledTemporaryFile(max_size=ARTIFACT_SPOOL_MAX_BYTES) as spool:
+        client = get_client()
+        async with client.stream(
+            "GET",
             f"{settings.github_api_url}/repos/{owner}/{repo}/actions/artifacts/{artifact_id}/zip",
             headers=github_auth.get_headers(token),
-        )
-        response.raise_for_status()
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                spool.write(chunk)
+
+        spool.seek(0)
+        yield spool
 
-    return response.content
 
+def _load_json(f: IO[bytes]) -> Any:
+    """Parse a JSON document from a binary stream.
 
-async def extract_evaluation_manifest(artifact_content: bytes) -> dict[str, Any] | None:
+    Uses orjson when installed and falls back to the standard library. Both
+    raise json.JSONDecodeError subclasses on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
+def _open_zip(artifact_content: bytes | IO[bytes]) -> zipfile.ZipFile:
+    """Open artifact zip content given as bytes or a binary file."""
+    if isinstance(artifact_content, bytes):
+        artifact_content = io.BytesIO(artifact_content)
+    return zipfile.ZipFile(artifact_content)
+
+
+async def extract_evaluation_manifest(
+    artifact_content: bytes | IO[bytes],
+) -> dict[str, Any] | None:
     """Extract evaluation_manifest.json from an artifact zip.
 
     Args:
-        artifact_content: Artifact zip content as bytes
+        artifact_content: Artifact zip content as bytes or a binary file
 
     Returns:
         Parsed evaluation manifest or None if not found
     """
     try:
-        with zipfile.ZipFile(io.BytesIO(artifact_content)) as zf:
+        with _open_zip(artifact_content) as zf:
             # Look for evaluation_manifest.json
-            for name in zf.namelist():
-                if name.endswith("evaluation_manifest.json"):
-                    with zf.open(name) as f:
-                        return json.load(f)
+            for info in zf.infolist():
+                if info.filename.endswith("evaluation_manifest.json"):
+                    with zf.open(info) as f:
+                        return _load_json(f)
     except (zipfile.BadZipFile, json.JSONDecodeError, KeyError):
         pass
 
     return None
 
 
-async def extract_results_summary(artifact_content: bytes) -> dict[str, Any] | None:
+async def extract_results_summary(
+    artifact_content: bytes | IO[bytes],
+) -> dict[str, Any] | None:
     """Extract results.json from an artifact zip.
 
     Args:
-        artifact_content: Artifact zip content as bytes
+        artifact_content: Artifact zip content as bytes or a binary file
 
     Returns:
         Parsed results summary or None if not found
     """
     try:
-        with zipfile.ZipFile(io.BytesIO(artifact_content)) as zf:
+        with _open_zip(artifact_content) as zf:
             # Look for results.json
-            for name in zf.namelist():
-                if name.endswith("results.json"):
-                    with zf.open(name) as f:
-                        return json.load(f)
+            for info in zf.infolist():
+                if info.filename.endswith("results.json"):
+                    with zf.open(info) as f:
+                        return _load_json(f)
     except (zipfile.BadZipFile, json.JSONDecodeError, KeyError):
         pass
 
@@ -221,25 +294,27 @@ async def get_evaluation_results(
     Returns:
         Tuple of (evaluation_manifest, results_summary)
     """
-    manifest = None
-    summary = None
+    # List the run's artifacts once and pick out the evidence and results ones
+    artifacts = await list_workflow_run_artifacts(installation_id, owner, repo, run_id)
+    evidence_artifact, results_artifact, _ = classify_artifacts(artifacts)
 
-    # Try to get the main evidence artifact
-    evidence_artifact = await find_evidence_artifact(installation_id, owner, repo, run_id)
-    if evidence_artifact:
-        content = await download_artifact(
+    async def fetch_manifest() -> dict[str, Any] | None:
+        if not evidence_artifact:
+            return None
+        async with download_artifact(
             installation_id, owner, repo, evidence_artifact["id"]
-        )
-        manifest = await extract_evaluation_manifest(content)
+        ) as content:
+            return await extract_evaluation_manifest(content)
 
-    # Try to get the results summary artifact
-    results_artifact = await find_results_artifact(installation_id, owner, repo, run_id)
-    if results_artifact:
-        content = await download_artifact(
+    async def fetch_summary() -> dict[str, Any] | None:
+        if not results_artifact:
+            return None
+        async with download_artifact(
             installation_id, owner, repo, results_artifact["id"]
-        )
-        summary = await extract_results_summary(content)
+        ) as content:
+            return await extract_results_summary(content)
 
+    manifest, summary = await asyncio.gather(fetch_manifest(), fetch_summary())
     return manifest, summary
 
 
@@ -252,18 +327,12 @@ def extract_ksi_id_from_artifact_name(artifact_name: str) -> str | None:
     Returns:
         KSI ID like 'KSI-MLA-05' or None if not found
     """
-    # Pattern: evidence_ksi-xxx-yy_sha_timestamp
-    if not artifact_name.startswith("evidence_ksi-"):
-        return None
-
-    parts = artifact_name.split("_")
-    if len(parts) < 2:
+    match = _KSI_ID_RE.match(artifact_name)
+    if match is None:
         return None
 
-    # parts[1] is like 'ksi-mla-05' or 'ksi-cna-01'
-    ksi_part = parts[1]  # e.g., 'ksi-mla-05'
-    # Convert to uppercase: 'KSI-MLA-05'
-    return ksi_part.upper()
+    # Group is like 'ksi-mla-05'; convert to uppercase: 'KSI-MLA-05'
+    return match.group(1).upper()
 
 
 async def get_all_ksi_evaluation_results(
@@ -271,6 +340,7 @@ async def get_all_ksi_evaluation_results(
     owner: str,
     repo: str,
     run_id: int,
+    artifacts: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     """Get evaluation results for all KSIs from workflow run artifacts.
 
@@ -279,33 +349,44 @@ async def get_all_ksi_evaluation_results(
         owner: Repository owner
         repo: Repository name
         run_id: Workflow run ID
+        artifacts: Optional KSI evidence artifacts already found for this run,
+            e.g. by find_all_evidence_artifacts; skips listing them again
 
     Returns:
         List of dicts with 'ksi_id', 'artifact_name', 'artifact_id', and 'manifest'
     """
-    results = []
-
     # Find all evidence artifacts
-    artifacts = await find_all_evidence_artifacts(installation_id, owner, repo, run_id)
+    if artifacts is None:
+        artifacts = await find_all_evidence_artifacts(installation_id, owner, repo, run_id)
 
-    for artifact in artifacts:
+    # Each artifact is an independent download, so fetch them concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def fetch_one(artifact: dict[str, Any]) -> dict[str, Any] | None:
         artifact_name = artifact.get("name", "")
         artifact_id = artifact.get("id")
         ksi_id = extract_ksi_id_from_artifact_name(artifact_name)
 
         if not ksi_id:
-            continue
+            return None
 
         # Download and extract manifest
-        content = await download_artifact(installation_id, owner, repo, artifact_id)
-        manifest = await extract_evaluation_manifest(content)
-
-        if manifest:
-            results.append({
-                "ksi_id": ksi_id,
-                "artifact_name": artifact_name,
-                "artifact_id": artifact_id,
-                "manifest": manifest,
-            })
-
-    return results
+        async with (
+            semaphore,
+            download_artifact(installation_id, owner, repo, artifact_id) as content,
+        ):
+            manifest = await extract_evaluation_manifest(content)
+
+        if not manifest:
+            return None
+
+        return {
+            "ksi_id": ksi_id,
+            "artifact_name": artifact_name,
+            "artifact_id": artifact_id,
+            "manifest": manifest,
+        }
+
+    # gather keeps results in artifact order
+    fetched = await asyncio.gather(*(fetch_one(artifact) for artifact in artifacts))
+    return [result for result in fetched if result is not None]
@@ -2,10 +2,10 @@
 
 from typing import Any
 
-import httpx
-
 from app.config import get_settings
+from app.gh_cache import cached_get_json
 from app.github_auth import github_auth
+from app.http_client import get_client
 from shared.constants import CHECK_RUN_NAME, CHECK_RUN_TITLE, KSI_REQUIREMENT_TEXT
 from shared.constants_cna import (
     CNA01_KSI_ID,
@@ -30,6 +30,17 @@ KSI_METADATA = {
     },
 }
 
+# KSI status to GitHub Check Run conclusion
+_STATUS_CONCLUSIONS = {
+    "PASS": "success",
+    "FAIL": "failure",
+    "ERROR": "neutral",  # As per spec, use neutral for errors
+}
+
+# Emoji shown next to the overall status and each criterion's status
+_STATUS_EMOJI = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}
+_CRITERION_EMOJI = {**_STATUS_EMOJI, "SKIP": "⏭️"}
+
 
 def get_ksi_metadata(ksi_id: str) -> dict[str, str]:
     """Get metadata for a KSI.
@@ -61,12 +72,7 @@ def status_to_conclusion(status: str) -> str:
     Returns:
         GitHub conclusion string
     """
-    mapping = {
-        "PASS": "success",
-        "FAIL": "failure",
-        "ERROR": "neutral",  # As per spec, use neutral for errors
-    }
-    return mapping.get(status, "neutral")
+    return _STATUS_CONCLUSIONS.get(status, "neutral")
 
 
 def build_check_run_summary(
@@ -113,12 +119,32 @@ def build_check_run_summary(
             "trigger_event": manifest.get("trigger_event", "N/A"),
         }
 
-    # Get criteria - MLA-05 has list, CNA-01 has dict
-    criteria = manifest.get("criteria", [])
-    is_criteria_dict = isinstance(criteria, dict)
+    return "\n".join(
+        (
+            _render_header(ksi_id, ksi_meta, status, summary_data, manifest.get("reasons", [])),
+            # Get criteria - MLA-05 has list, CNA-01 has dict
+            _render_criteria(manifest.get("criteria", [])),
+            _render_footer(
+                scope,
+                process,
+                manifest.get("trigger_event", "N/A"),
+                artifact_name,
+                run_url,
+            ),
+        )
+    )
+
 
+def _render_header(
+    ksi_id: str,
+    ksi_meta: dict[str, str],
+    status: str | None,
+    summary_data: dict[str, Any],
+    reasons: list[str],
+) -> str:
+    """Render the title, requirement, status, and summary sections."""
     # Status emoji
-    status_emoji = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}.get(status, "❓")
+    status_emoji = _STATUS_EMOJI.get(status, "❓")
 
     lines = [
         f"## {status_emoji} {ksi_id}: {ksi_meta['ksi_name']}",
@@ -132,94 +158,109 @@ def build_check_run_summary(
 
     # CNA-01 summary stats
     if summary_data and "security_groups_evaluated" in summary_data:
-        lines.append("### Summary")
-        lines.append(f"- **Security Groups Evaluated:** {summary_data.get('security_groups_evaluated', 0)}")
-        lines.append(f"- **Compliant:** {summary_data.get('security_groups_compliant', 0)}")
-        lines.append(f"- **Non-Compliant:** {summary_data.get('security_groups_non_compliant', 0)}")
-        lines.append("")
+        lines += (
+            "### Summary",
+            f"- **Security Groups Evaluated:** {summary_data.get('security_groups_evaluated', 0)}",
+            f"- **Compliant:** {summary_data.get('security_groups_compliant', 0)}",
+            f"- **Non-Compliant:** {summary_data.get('security_groups_non_compliant', 0)}",
+            "",
+        )
 
     # MLA-05 reasons
-    reasons = manifest.get("reasons", [])
     if reasons:
         lines.append("### Summary")
-        for reason in reasons:
-            lines.append(f"- {reason}")
+        lines += (f"- {reason}" for reason in reasons)
         lines.append("")
 
-    # Criteria results
-    lines.append("### Criteria Evaluation")
-    lines.append("")
-    lines.append("| Criterion | Name | Status | Details |")
-    lines.append("|-----------|------|--------|---------|")
+    return "\n".join(lines)
+
+
+def _render_criteria(criteria: dict[str, Any] | list[dict[str, Any]]) -> str:
+    """Render the criteria evaluation table."""
+    lines = [
+        "### Criteria Evaluation",
+        "",
+        "| Criterion | Name | Status | Details |",
+        "|-----------|------|--------|---------|",
+    ]
+
+    # Bind hot lookups to locals once, outside the per-criterion loops
+    add_line = lines.append
+    criterion_emoji = _CRITERION_EMOJI.get
 
-    if is_criteria_dict:
+    if isinstance(criteria, dict):
         # CNA-01 style: dict with criterion IDs as keys
         for crit_id, criterion in criteria.items():
-            crit_status = criterion.get("status", "UNKNOWN")
-            crit_emoji = {
-                "PASS": "✅",
-                "FAIL": "❌",
-                "ERROR": "⚠️",
-                "SKIP": "⏭️",
-            }.get(crit_status, "❓")
+            get = criterion.get
+            crit_status = get("status", "UNKNOWN")
+            crit_emoji = criterion_emoji(crit_status, "❓")
             # Show finding count for CNA-01
-            findings = criterion.get("findings", [])
-            details = f"{len(findings)} finding(s)" if findings else criterion.get("reason", "N/A")
-            lines.append(
-                f"| {criterion.get('id', crit_id)} | {criterion.get('name', 'N/A')} | {crit_emoji} {crit_status} | {details} |"
+            findings = get("findings", [])
+            details = f"{len(findings)} finding(s)" if findings else get("reason", "N/A")
+            add_line(
+                f"| {get('id', crit_id)} | {get('name', 'N/A')} | {crit_emoji} {crit_status} | {details} |"
             )
     else:
         # MLA-05 style: list of criterion dicts
         for criterion in criteria:
-            crit_status = criterion.get("status", "UNKNOWN")
-            crit_emoji = {
-                "PASS": "✅",
-                "FAIL": "❌",
-                "ERROR": "⚠️",
-                "SKIP": "⏭️",
-            }.get(crit_status, "❓")
-            lines.append(
-                f"| {criterion.get('id', 'N/A')} | {criterion.get('name', 'N/A')} | {crit_emoji} {crit_status} | {criterion.get('reason', 'N/A')} |"
+            get = criterion.get
+            crit_status = get("status", "UNKNOWN")
+            crit_emoji = criterion_emoji(crit_status, "❓")
+            add_line(
+                f"| {get('id', 'N/A')} | {get('name', 'N/A')} | {crit_emoji} {crit_status} | {get('reason', 'N/A')} |"
             )
 
-    lines.append("")
+    add_line("")
+    return "\n".join(lines)
 
-    # Scope
-    lines.append("### Scope")
+
+def _render_footer(
+    scope: dict[str, Any],
+    process: dict[str, Any],
+    trigger_event: str,
+    artifact_name: str | None,
+    run_url: str | None,
+) -> str:
+    """Render the scope, process, evidence artifact, and footer sections."""
     repo = scope.get("repository", "N/A")
     commit = scope.get("commit_sha", "N/A")
-    lines.append(f"- **Repository:** {repo}")
-    lines.append(f"- **Commit:** `{commit[:7] if len(commit) > 7 else commit}`")
     config_surfaces = scope.get("configuration_surfaces", [])
+    tf_paths = scope.get("terraform_paths", [])
+    workflow_name = process.get("workflow_name")
+    run_id = process.get("workflow_run_id")
+    actor = process.get("actor")
+
+    # Scope
+    lines = [
+        "### Scope",
+        f"- **Repository:** {repo}",
+        f"- **Commit:** `{commit[:7] if len(commit) > 7 else commit}`",
+    ]
     if config_surfaces:
         lines.append(f"- **Configuration Surfaces:** {', '.join(config_surfaces)}")
-    tf_paths = scope.get("terraform_paths", [])
     if tf_paths:
         lines.append(f"- **Terraform Paths:** {', '.join(tf_paths)}")
     lines.append("")
 
     # Process
     lines.append("### Process")
-    if process.get("workflow_name"):
-        lines.append(f"- **Workflow:** {process.get('workflow_name', 'N/A')}")
-    lines.append(f"- **Trigger:** `{process.get('trigger_event', manifest.get('trigger_event', 'N/A'))}`")
-    if run_url and process.get("workflow_run_id"):
-        lines.append(f"- **Run:** [{process.get('workflow_run_id', 'N/A')}]({run_url})")
-    elif process.get("workflow_run_id"):
-        lines.append(f"- **Run ID:** {process.get('workflow_run_id', 'N/A')}")
-    if process.get("actor"):
-        lines.append(f"- **Actor:** {process.get('actor', 'N/A')}")
+    if workflow_name:
+        lines.append(f"- **Workflow:** {workflow_name}")
+    lines.append(f"- **Trigger:** `{process.get('trigger_event', trigger_event)}`")
+    if run_url and run_id:
+        lines.append(f"- **Run:** [{run_id}]({run_url})")
+    elif run_id:
+        lines.append(f"- **Run ID:** {run_id}")
+    if actor:
+        lines.append(f"- **Actor:** {actor}")
     lines.append("")
 
     # Evidence artifact
     if artifact_name:
-        lines.append("### Evidence Artifact")
-        lines.append(f"- **Name:** `{artifact_name}`")
-        lines.append("")
+        lines += ("### Evidence Artifact", f"- **Name:** `{artifact_name}`", "")
 
     # Footer
-    lines.append("---")
-    lines.append("*Generated by FedRAMP 20x KSI Evidence Action*")
+    lines += ("---", "*Generated by FedRAMP 20x KSI Evidence Action*")
 
     return "\n".join(lines)
 
@@ -270,13 +311,13 @@ async def create_check_run(
         },
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{settings.github_api_url}/repos/{owner}/{repo}/check-runs",
-            headers=github_auth.get_headers(token),
-            json=payload,
-        )
-        response.raise_for_status()
+    client = get_client()
+    response = await client.post(
+        f"{settings.github_api_url}/repos/{owner}/{repo}/check-runs",
+        headers=github_auth.get_headers(token),
+        json=payload,
+    )
+    response.raise_for_status()
 
     return response.json()
 
@@ -325,13 +366,13 @@ async def update_check_run(
         },
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(
-            f"{settings.github_api_url}/repos/{owner}/{repo}/check-runs/{check_run_id}",
-            headers=github_auth.get_headers(token),
-            json=payload,
-        )
-        response.raise_for_status()
+    client = get_client()
+    response = await client.patch(
+        f"{settings.github_api_url}/repos/{owner}/{repo}/check-runs/{check_run_id}",
+        headers=github_auth.get_headers(token),
+        json=payload,
+    )
+    response.raise_for_status()
 
     return response.json()
 
@@ -359,14 +400,15 @@ async def find_existing_check_run(
     settings = get_settings()
     ksi_meta = get_ksi_metadata(ksi_id)
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{settings.github_api_url}/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
-            headers=github_auth.get_headers(token),
-            params={"check_name": ksi_meta["check_run_name"]},
-        )
-        response.raise_for_status()
-        data = response.json()
+    # Revalidated on every call (ttl=0): a check run created moments ago must
+    # be seen, or a re-run would create a duplicate. Unchanged lists cost a 304.
+    data = await cached_get_json(
+        ("check-runs", installation_id, owner, repo, head_sha, ksi_meta["check_run_name"]),
+        f"{settings.github_api_url}/repos/{owner}/{repo}/commits/{head_sha}/check-runs",
+        github_auth.get_headers(token),
+        params={"check_name": ksi_meta["check_run_name"]},
+        ttl=0,
+    )
 
     check_runs = data.get("check_runs", [])
     if check_runs:
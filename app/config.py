@@ -1,7 +1,9 @@
 """Configuration for the GitHub App."""
 
+import fnmatch
 import os
-from functools import lru_cache
+import re
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -36,6 +38,11 @@ class Settings(BaseSettings):
         description="Name of the results summary artifact",
     )
 
+    @cached_property
+    def evidence_artifact_regex(self) -> re.Pattern[str]:
+        """Compiled form of artifact_name_pattern, translated once per settings."""
+        return re.compile(fnmatch.translate(self.artifact_name_pattern))
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
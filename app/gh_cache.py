@@ -0,0 +1,70 @@
+"""Short-lived cache for GitHub API GET responses.
+
+One webhook can ask for the same run's artifacts or the same commit's check
+runs several times. Responses are kept in process for a short TTL, and stale
+entries are revalidated with If-None-Match so an unchanged resource costs a
+304 instead of a full payload (GitHub does not count 304s against the rate
+limit).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.http_client import get_client
+
+DEFAULT_TTL_SECONDS = 90.0
+MAX_ENTRIES = 1024
+
+# Key -> (monotonic expiry, ETag or None, decoded JSON body), oldest first
+_cache: OrderedDict[tuple[Any, ...], tuple[float, str | None, Any]] = OrderedDict()
+
+
+async def cached_get_json(
+    key: tuple[Any, ...],
+    url: str,
+    headers: dict[str, str],
+    params: dict[str, Any] | None = None,
+    ttl: float = DEFAULT_TTL_SECONDS,
+) -> Any:
+    """GET a JSON resource, reusing a cached body while it is fresh.
+
+    Args:
+        key: Cache key; include the installation ID so tokens with different
+            scopes never share entries
+        url: Resource URL
+        headers: Request headers, including authorization
+        params: Optional query parameters
+        ttl: Seconds a response is served without asking GitHub; 0 revalidates
+            on every call
+
+    Returns:
+        Decoded JSON body. Callers must not mutate it, since it is shared.
+    """
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now < entry[0]:
+        _cache.move_to_end(key)
+        return entry[2]
+
+    request_headers = headers
+    if entry is not None and entry[1]:
+        request_headers = {**headers, "If-None-Match": entry[1]}
+
+    response = await get_client().get(url, headers=request_headers, params=params)
+    if entry is not None and response.status_code == 304:
+        etag, data = entry[1], entry[2]
+    else:
+        response.raise_for_status()
+        etag, data = response.headers.get("ETag"), response.json()
+
+    _cache[key] = (now + ttl, etag, data)
+    _cache.move_to_end(key)
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return data
+
+
+def clear_cache() -> None:
+    """Drop every cached response."""
+    _cache.clear()
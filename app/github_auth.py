@@ -1,14 +1,27 @@
 """GitHub App authentication utilities."""
 
+import asyncio
 import base64
 import time
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import httpx
 import jwt
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 from app.config import get_settings
+from app.http_client import get_client
+
+# App JWTs are valid for 10 minutes; a cached one is reused until it is
+# within JWT_REUSE_MARGIN_SECONDS of expiring
+JWT_LIFETIME_SECONDS = 10 * 60
+JWT_REUSE_MARGIN_SECONDS = 60
+
+# Installation tokens are refreshed this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
 
 
 class GitHubAppAuth:
@@ -18,20 +31,44 @@ class GitHubAppAuth:
         """Initialize the auth handler."""
         self.settings = get_settings()
         self._installation_tokens: dict[int, tuple[str, float]] = {}
+        # One lock per installation, so concurrent callers share a single refresh
+        self._token_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._private_key: PrivateKeyTypes | None = None
+        self._jwt: tuple[str, float] | None = None
 
     def _generate_jwt(self) -> str:
         """Generate a JWT for GitHub App authentication.
 
+        The signed JWT is cached and reused until shortly before it expires.
+
         Returns:
             JWT token string
         """
+        if self._jwt is not None:
+            token, expires_at = self._jwt
+            if time.time() < expires_at - JWT_REUSE_MARGIN_SECONDS:
+                return token
+
         now = int(time.time())
         payload = {
             "iat": now - 60,  # Issued 60 seconds ago to account for clock drift
-            "exp": now + (10 * 60),  # Expires in 10 minutes
+            "exp": now + JWT_LIFETIME_SECONDS,  # Expires in 10 minutes
             "iss": self.settings.github_app_id,
         }
 
+        token = jwt.encode(payload, self._load_private_key(), algorithm="RS256")
+        self._jwt = (token, now + JWT_LIFETIME_SECONDS)
+        return token
+
+    def _load_private_key(self) -> PrivateKeyTypes:
+        """Load the App's private key once and keep the parsed key object.
+
+        Returns:
+            Private key object, so signing skips PEM parsing
+        """
+        if self._private_key is not None:
+            return self._private_key
+
         # Handle private key (may be PEM content, base64-encoded, or file path)
         private_key = self.settings.github_app_private_key
 
@@ -55,12 +92,14 @@ class GitHubAppAuth:
                     "GITHUB_APP_PRIVATE_KEY must be PEM content, a file path, or base64-encoded PEM"
                 )
 
-        return jwt.encode(payload, key, algorithm="RS256")
+        self._private_key = load_pem_private_key(key.encode("utf-8"), password=None)
+        return self._private_key
 
     async def get_installation_token(self, installation_id: int) -> str:
         """Get an installation access token.
 
-        Caches tokens until they're close to expiration.
+        Caches tokens until they're close to expiration. Concurrent callers that
+        miss the cache wait for a single refresh instead of each requesting one.
 
         Args:
             installation_id: GitHub App installation ID
@@ -68,30 +107,54 @@ class GitHubAppAuth:
         Returns:
             Installation access token
         """
-        # Check cache
+        token = self._cached_token(installation_id)
+        if token is not None:
+            return token
+
+        async with self._token_locks[installation_id]:
+            # Another caller may have refreshed the token while we waited
+            token = self._cached_token(installation_id)
+            if token is not None:
+                return token
+            return await self._request_installation_token(installation_id)
+
+    def _cached_token(self, installation_id: int) -> str | None:
+        """Get a cached installation token that is not about to expire."""
         if installation_id in self._installation_tokens:
             token, expires_at = self._installation_tokens[installation_id]
-            if time.time() < expires_at - 300:  # 5 minute buffer
+            if time.time() < expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
                 return token
+        return None
+
+    async def _request_installation_token(self, installation_id: int) -> str:
+        """Request a new installation token from GitHub and cache it.
+
+        Args:
+            installation_id: GitHub App installation ID
 
-        # Generate new token
+        Returns:
+            Installation access token
+        """
         jwt_token = self._generate_jwt()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.settings.github_api_url}/app/installations/{installation_id}/access_tokens",
-                headers={
-                    "Authorization": f"Bearer {jwt_token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_client()
+        response = await client.post(
+            f"{self.settings.github_api_url}/app/installations/{installation_id}/access_tokens",
+            headers={
+                "Authorization": f"Bearer {jwt_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         token = data["token"]
         # Parse expiration time (GitHub returns ISO 8601)
-        expires_at = time.time() + 3600  # Default to 1 hour
+        try:
+            expires_at = datetime.fromisoformat(data["expires_at"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            expires_at = time.time() + 3600  # Default to 1 hour
 
         self._installation_tokens[installation_id] = (token, expires_at)
         return token
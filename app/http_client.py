@@ -0,0 +1,41 @@
+"""Shared HTTP client for GitHub API calls."""
+
+import importlib.util
+
+import httpx
+
+# HTTP/2 needs the h2 package (httpx[http2]); without it the client still
+# pools keep-alive HTTP/1.1 connections
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the process-wide GitHub API client, creating it on first use.
+
+    Reusing one client keeps connections to the API alive across requests
+    instead of paying a TCP and TLS handshake per call.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client, if one was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
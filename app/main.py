@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse
 from app.artifacts import find_all_evidence_artifacts, get_all_ksi_evaluation_results
 from app.checks import create_check_run, find_existing_check_run, update_check_run
 from app.config import get_settings
+from app.http_client import close_client
 from app.webhook import get_verified_payload
 
 # Configure logging
@@ -33,6 +34,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.environment}")
     yield
     logger.info("Shutting down")
+    await close_client()
 
 
 app = FastAPI(
@@ -98,7 +100,9 @@ async def process_workflow_run(payload: dict[str, Any]) -> None:
         logger.info(f"Found {len(evidence_artifacts)} evidence artifact(s)")
 
         # Get evaluation results for all KSIs
-        ksi_results = await get_all_ksi_evaluation_results(installation_id, owner, repo, run_id)
+        ksi_results = await get_all_ksi_evaluation_results(
+            installation_id, owner, repo, run_id, evidence_artifacts
+        )
 
         if not ksi_results:
             logger.error("Could not extract evaluation manifests from artifacts")
@@ -86,10 +86,10 @@ CNA01_CHECK_RUN_TITLE = "FedRAMP 20x KSI Evidence: KSI-CNA-01 Restrict Network T
 # --- Common Network Constants ---
 
 # CIDR blocks that indicate unrestricted access
-UNRESTRICTED_CIDRS = {"0.0.0.0/0", "::/0"}
+UNRESTRICTED_CIDRS = frozenset({"0.0.0.0/0", "::/0"})
 
 # Protocol value that means "all protocols"
-ALL_PROTOCOLS = {"-1", "all"}
+ALL_PROTOCOLS = frozenset({"-1", "all"})
 
 # Directories to exclude when scanning
 EXCLUDED_DIRS = {
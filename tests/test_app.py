@@ -2,7 +2,10 @@
 
 import hashlib
 import hmac
+import io
 import json
+import zipfile
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -242,3 +245,133 @@ class TestStatusMapping:
         assert status_to_conclusion("FAIL") == "failure"
         assert status_to_conclusion("ERROR") == "neutral"
         assert status_to_conclusion("UNKNOWN") == "neutral"
+
+
+class TestArtifactResults:
+    """Tests for collecting KSI results from workflow run artifacts."""
+
+    async def test_collects_manifests_in_artifact_order(self):
+        """Should fetch every KSI artifact and keep the listing order."""
+        from app import artifacts
+
+        def make_zip(ksi_id: str) -> bytes:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as zf:
+                zf.writestr("evaluation_manifest.json", json.dumps({"ksi_id": ksi_id}))
+            return buffer.getvalue()
+
+        listed = [
+            {"id": 1, "name": "evidence_ksi-mla-05_abc1234_20250101"},
+            {"id": 2, "name": "evidence_other"},
+            {"id": 3, "name": "evidence_ksi-cna-01_abc1234_20250101"},
+        ]
+        contents = {1: make_zip("KSI-MLA-05"), 3: make_zip("KSI-CNA-01")}
+
+        @asynccontextmanager
+        async def download(installation_id, owner, repo, artifact_id):
+            yield io.BytesIO(contents[artifact_id])
+
+        with (
+            patch.object(
+                artifacts, "find_all_evidence_artifacts", AsyncMock(return_value=listed)
+            ),
+            patch.object(artifacts, "download_artifact", download),
+        ):
+            results = await artifacts.get_all_ksi_evaluation_results(1, "test", "repo", 42)
+
+        assert [r["ksi_id"] for r in results] == ["KSI-MLA-05", "KSI-CNA-01"]
+        assert [r["artifact_id"] for r in results] == [1, 3]
+        assert results[1]["manifest"] == {"ksi_id": "KSI-CNA-01"}
+
+    def test_classifies_artifacts_in_one_pass(self, mock_settings):
+        """Should pick out the evidence, results, and per-KSI artifacts."""
+        from app.artifacts import classify_artifacts
+
+        listed = [
+            {"id": 1, "name": "build-logs"},
+            {"id": 2, "name": "evidence_ksi-mla-05_abc1234_20250101"},
+            {"id": 3, "name": "fedramp-ksi-results"},
+            {"id": 4, "name": "evidence_ksi-cna-01_abc1234_20250101"},
+        ]
+
+        evidence, results, all_evidence = classify_artifacts(listed, mock_settings)
+
+        assert evidence["id"] == 2
+        assert results["id"] == 3
+        assert [a["id"] for a in all_evidence] == [2, 4]
+
+
+class TestResponseCache:
+    """Tests for the GitHub API response cache."""
+
+    async def test_revalidates_stale_entry_with_etag(self):
+        """Should serve fresh entries locally and revalidate stale ones."""
+        import httpx
+
+        from app import gh_cache
+
+        seen_etags = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"artifacts": []}, headers={"ETag": '"v1"'})
+
+        gh_cache.clear_cache()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        url = "https://api.github.com/repos/test/repo/actions/runs/1/artifacts"
+
+        with patch.object(gh_cache, "get_client", return_value=client):
+            first = await gh_cache.cached_get_json(("k",), url, {})
+            fresh = await gh_cache.cached_get_json(("k",), url, {})
+            assert seen_etags == [None]
+
+            # ttl=0 entries are stale at once and revalidated on the next call
+            await gh_cache.cached_get_json(("k0",), url, {}, ttl=0)
+            revalidated = await gh_cache.cached_get_json(("k0",), url, {}, ttl=0)
+
+        await client.aclose()
+        gh_cache.clear_cache()
+
+        assert first == fresh == revalidated == {"artifacts": []}
+        assert seen_etags == [None, None, '"v1"']
+
+
+class TestInstallationTokens:
+    """Tests for installation token caching."""
+
+    async def test_concurrent_callers_share_one_refresh(self):
+        """Should request one token for concurrent cache misses."""
+        import asyncio
+        from datetime import datetime, timezone
+
+        import httpx
+
+        from app.github_auth import GitHubAppAuth
+
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0)
+            return httpx.Response(
+                201, json={"token": "ghs_test", "expires_at": "2999-01-01T00:00:00Z"}
+            )
+
+        auth = GitHubAppAuth()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with (
+            patch("app.github_auth.get_client", return_value=client),
+            patch.object(auth, "_generate_jwt", return_value="jwt"),
+        ):
+            tokens = await asyncio.gather(*(auth.get_installation_token(7) for _ in range(5)))
+
+        await client.aclose()
+
+        assert tokens == ["ghs_test"] * 5
+        assert len(requests) == 1
+        # Expiry comes from the response rather than a fixed one hour
+        expected = datetime(2999, 1, 1, tzinfo=timezone.utc).timestamp()
+        assert auth._installation_tokens[7][1] == expected
@@ -82,6 +82,20 @@ class TestScanForTerraform:
             assert "." in result.tf_paths
             assert "modules/vpc" in result.tf_paths
 
+    def test_excludes_hidden_and_vendored_directories(self):
+        """Should not descend into hidden or excluded directories."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in (".github", "node_modules", "venv"):
+                excluded = Path(tmpdir) / name / "nested"
+                excluded.mkdir(parents=True)
+                (excluded / "main.tf").write_text("# should be ignored")
+            (Path(tmpdir) / "main.tf").write_text("# root config")
+
+            result = scan_for_terraform(tmpdir)
+
+            assert result.tf_file_count == 1
+            assert result.tf_paths == ["."]
+
 
 class TestGetTfRootPaths:
     """Tests for get_tf_root_paths function."""
@@ -1,5 +1,6 @@
 """Tests for evidence pack generation module."""
 
+import hashlib
 import json
 import tempfile
 import zipfile
@@ -239,3 +240,32 @@ class TestBuildEvidencePack:
             assert zip_path.exists()
             # Should be FAIL or ERROR due to no Terraform
             assert status in [KSIStatus.FAIL, KSIStatus.ERROR]
+
+    def test_hashes_match_written_files(self):
+        """Should record SHA-256 digests that match the files on disk."""
+        fixtures_path = Path(__file__).parent / "fixtures" / "pass-repo"
+        detection = scan_for_terraform(fixtures_path)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            build_evidence_pack(
+                output_dir=tmpdir,
+                detection=detection,
+                inventory=None,
+                eval_result=None,
+                repository="test/repo",
+                commit_sha="abc1234567890",
+                workflow_name="Test Workflow",
+                workflow_run_id="12345",
+                workflow_run_url="https://github.com/test/repo/actions/runs/12345",
+                trigger_event="schedule",
+                actor="test-user",
+            )
+
+            hashes_path = Path(tmpdir) / "evidence" / "ksi-mla-05" / "hashes.sha256"
+            lines = hashes_path.read_text().splitlines()
+            assert lines
+
+            for line in lines:
+                digest, rel_path = line.split("  ", 1)
+                content = (Path(tmpdir) / rel_path).read_bytes()
+                assert hashlib.sha256(content).hexdigest() == digest
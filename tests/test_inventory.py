@@ -5,11 +5,13 @@ from pathlib import Path
 import pytest
 
 from action.src.inventory import (
+    PARALLEL_PARSE_MIN_FILES,
     extract_modules,
     extract_providers,
     extract_resources,
     generate_inventory,
     parse_tf_file,
+    parse_tf_files,
 )
 
 
@@ -42,6 +44,20 @@ class TestParseTfFile:
 
         assert result is None
 
+    def test_memoizes_unchanged_file(self, tmp_path):
+        """Should reuse the parse for an unchanged file and reparse edits."""
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text('resource "aws_vpc" "main" {\n  cidr_block = "10.0.0.0/16"\n}\n')
+
+        first = parse_tf_file(tf_file)
+        assert parse_tf_file(str(tf_file)) is first
+
+        tf_file.write_text('resource "aws_subnet" "main" {\n  vpc_id = "vpc-1"\n}\n')
+        second = parse_tf_file(tf_file)
+
+        assert second is not first
+        assert "aws_subnet" in second["resource"][0]
+
 
 class TestExtractProviders:
     """Tests for extract_providers function."""
@@ -81,6 +97,22 @@ class TestExtractProviders:
         assert len(providers) == 1
         assert providers[0].name == "google"
 
+    def test_skips_provider_blocks_already_declared(self):
+        """Should not duplicate providers declared in required_providers or aliased."""
+        parsed = {
+            "terraform": [{"required_providers": [{"aws": {"source": "hashicorp/aws"}}]}],
+            "provider": [
+                {"aws": {"region": "us-east-1"}},
+                {"google": {"project": "a"}},
+                {"google": {"project": "b", "alias": "secondary"}},
+            ],
+        }
+
+        providers = extract_providers(parsed, "main.tf")
+
+        assert [p.name for p in providers] == ["aws", "google"]
+        assert providers[0].source == "hashicorp/aws"
+
 
 class TestExtractModules:
     """Tests for extract_modules function."""
@@ -125,6 +157,19 @@ class TestExtractResources:
         assert "aws_instance" in resources
         assert "aws_s3_bucket" in resources
 
+    def test_records_declaring_file_once_per_type(self):
+        """Should list a file once however many instances it declares."""
+        parsed = {
+            "resource": [
+                {"aws_instance": {"web": {"ami": "ami-123"}, "api": {"ami": "ami-456"}}},
+                {"aws_instance": {"worker": {"ami": "ami-789"}}},
+            ]
+        }
+
+        resources = extract_resources(parsed, "main.tf")
+
+        assert resources == {"aws_instance": ["main.tf"]}
+
 
 class TestGenerateInventory:
     """Tests for generate_inventory function."""
@@ -159,3 +204,29 @@ class TestGenerateInventory:
         assert inventory.resources.total_count == 0
         assert len(inventory.providers) == 0
         assert len(inventory.modules) == 0
+
+    def test_parallel_parse_matches_inventory(self, tmp_path):
+        """Should aggregate results when parsing across a process pool."""
+        file_count = PARALLEL_PARSE_MIN_FILES + 2
+        for i in range(file_count):
+            (tmp_path / f"bucket_{i}.tf").write_text(
+                f'resource "aws_s3_bucket" "b{i}" {{\n  bucket = "bucket-{i}"\n}}\n'
+            )
+
+        inventory = generate_inventory(tmp_path)
+
+        assert len(inventory.files_analyzed) == file_count
+        assert inventory.resources.by_type["aws_s3_bucket"].count == file_count
+
+    def test_reuses_parsed_files(self):
+        """Should produce the same inventory from pre-parsed files."""
+        fixtures_path = Path(__file__).parent / "fixtures" / "pass-repo"
+        parsed_files = parse_tf_files(fixtures_path)
+
+        direct = generate_inventory(fixtures_path).model_dump(exclude={"generated_at"})
+        reused = generate_inventory(fixtures_path, parsed_files=parsed_files).model_dump(
+            exclude={"generated_at"}
+        )
+
+        assert sorted(rel_path for rel_path, _ in parsed_files) == direct["files_analyzed"]
+        assert reused == direct
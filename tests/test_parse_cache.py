@@ -0,0 +1,112 @@
+"""Tests for the on-disk parse cache."""
+
+import os
+
+from action.src import parse_cache
+from action.src.parse_cache import CACHE_DIR_ENV_VAR, CACHE_ENV_VAR, cached_parse
+
+
+def _counting_parser():
+    calls: list[str] = []
+
+    def parse(file_path):
+        calls.append(str(file_path))
+        return {"resource": [{"aws_vpc": {"main": {"cidr_block": "10.0.0.0/16"}}}]}
+
+    return parse, calls
+
+
+class TestCachedParse:
+    """Tests for cached_parse function."""
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        """Should call the parser every time when the cache is off."""
+        monkeypatch.delenv(CACHE_ENV_VAR, raising=False)
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        cached_parse(tf_file, parse)
+        cached_parse(tf_file, parse)
+
+        assert len(calls) == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_reuses_result_for_unchanged_file(self, tmp_path, monkeypatch):
+        """Should serve an unchanged file from the cache."""
+        monkeypatch.setenv(CACHE_ENV_VAR, "1")
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        first = cached_parse(tf_file, parse)
+        second = cached_parse(tf_file, parse)
+
+        assert len(calls) == 1
+        assert first == second
+
+    def test_reparses_modified_file(self, tmp_path, monkeypatch):
+        """Should parse again when the file's mtime or size changes."""
+        monkeypatch.setenv(CACHE_ENV_VAR, "1")
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        cached_parse(tf_file, parse)
+        tf_file.write_text("# changed config")
+        st = tf_file.stat()
+        os.utime(tf_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cached_parse(tf_file, parse)
+
+        assert len(calls) == 2
+
+    def test_reuses_result_for_touched_file(self, tmp_path, monkeypatch):
+        """Should serve a file whose mtime changed but content did not."""
+        monkeypatch.setenv(CACHE_ENV_VAR, "1")
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        cached_parse(tf_file, parse)
+        st = tf_file.stat()
+        os.utime(tf_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cached_parse(tf_file, parse)
+        cached_parse(tf_file, parse)
+
+        assert len(calls) == 1
+
+    def test_reparses_same_size_edit(self, tmp_path, monkeypatch):
+        """Should parse again when content changes but size does not."""
+        monkeypatch.setenv(CACHE_ENV_VAR, "1")
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        cached_parse(tf_file, parse)
+        tf_file.write_text("# CONFIG")
+        st = tf_file.stat()
+        os.utime(tf_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cached_parse(tf_file, parse)
+
+        assert len(calls) == 2
+
+    def test_ignores_entries_from_other_schema_versions(self, tmp_path, monkeypatch):
+        """Should parse again when the cache schema version changes."""
+        monkeypatch.setenv(CACHE_ENV_VAR, "1")
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("# config")
+        parse, calls = _counting_parser()
+
+        cached_parse(tf_file, parse)
+        monkeypatch.setattr(
+            parse_cache, "CACHE_SCHEMA_VERSION", parse_cache.CACHE_SCHEMA_VERSION + 1
+        )
+        cached_parse(tf_file, parse)
+
+        assert len(calls) == 2